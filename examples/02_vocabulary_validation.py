@@ -13,9 +13,8 @@ from pulse import PulseMessage, Vocabulary, MessageValidator, ValidationError
 
 def print_section(title):
     """Print a section header."""
-    print("\n" + "=" * 60)
-    print(title)
-    print("=" * 60)
+    rule = "=" * 60
+    print(f"\n{rule}\n{title}\n{rule}")
 
 
 def example_vocabulary_categories():
@@ -153,8 +152,8 @@ def example_list_by_category():
         print(f"  ... and {len(actions) - 10} more")
 
     # List entity concepts
-    print(f"\nENT (Entities) - {len(Vocabulary.list_by_category('ENT'))} concepts:")
     entities = Vocabulary.list_by_category("ENT")
+    print(f"\nENT (Entities) - {len(entities)} concepts:")
     for concept in sorted(entities)[:10]:  # Show first 10
         print(f"  {concept}")
     if len(entities) > 10:
@@ -15,9 +15,8 @@ import json
 
 def print_header(title):
     """Print a section header."""
-    print("\n" + "="*70)
-    print(f"  {title}")
-    print("="*70 + "\n")
+    rule = "=" * 70
+    print(f"\n{rule}\n  {title}\n{rule}\n")
 
 
 def use_case_1_sentiment_analysis():
@@ -275,8 +274,7 @@ def use_case_6_vocabulary_exploration():
     print("Discovering what actions are available...\n")
 
     # Show available action categories
-    actions = Vocabulary.list_by_category("ACT")
-    analyze_actions = [a for a in actions if "ANALYZE" in a]
+    analyze_actions = Vocabulary.list_by_prefix("ACT.ANALYZE")
 
     print(f"Analysis Actions ({len(analyze_actions)} available):")
     for action in sorted(analyze_actions):
@@ -287,8 +285,7 @@ def use_case_6_vocabulary_exploration():
 
     # Show data types
     print("Supported Data Types:")
-    data_types = Vocabulary.list_by_category("ENT")
-    data_entities = [d for d in data_types if d.startswith("ENT.DATA")]
+    data_entities = Vocabulary.list_by_prefix("ENT.DATA")
     for dtype in sorted(data_entities)[:8]:
         desc = Vocabulary.get_description(dtype)
         print(f"  • {dtype}: {desc}")
@@ -296,7 +293,7 @@ def use_case_6_vocabulary_exploration():
 
     # Show meta operations
     print("Protocol Status Codes:")
-    meta_statuses = [m for m in Vocabulary.list_by_category("META") if "STATUS" in m]
+    meta_statuses = Vocabulary.list_by_prefix("META.STATUS")
     for status in sorted(meta_statuses):
         desc = Vocabulary.get_description(status)
         print(f"  • {status}: {desc}")
@@ -167,8 +167,12 @@ def demo_retry_strategy():
     max_retries = 5
     base_delay = 0.1  # 100ms
 
+    # Backoff schedule computed once: 0.1s, 0.2s, 0.4s, ...
+    delays = [base_delay * (2 ** i) for i in range(max_retries - 1)]
+
     print("Attempting operation with exponential backoff:")
     for attempt in range(1, max_retries + 1):
+        started = time.monotonic()
         try:
             print(f"  Attempt {attempt}...", end=" ")
             result = simulate_flaky_operation(attempt)
@@ -178,9 +182,10 @@ def demo_retry_strategy():
             print(f"✗ Failed: {e}")
 
             if attempt < max_retries:
-                delay = base_delay * (2 ** (attempt - 1))
+                delay = delays[attempt - 1]
                 print(f"    → Retrying in {delay:.1f}s")
-                time.sleep(delay)
+                # Wait until the deadline; time spent failing counts toward it
+                time.sleep(max(0.0, started + delay - time.monotonic()))
             else:
                 print(f"    → Max retries reached, giving up")
     print()
@@ -10,7 +10,7 @@ This example demonstrates:
 6. Tamper detection
 """
 
-from pulse import PulseMessage, SecurityManager, KeyManager
+from pulse import PulseMessage, SecurityManager, KeyManager, NonceStore
 from datetime import datetime, timezone, timedelta
 import time
 
@@ -103,7 +103,8 @@ def demo_replay_protection():
     print_header("3. Replay Attack Protection")
 
     security = SecurityManager()
-    nonce_store = set()
+    # Remembers nonces for the 5 minute max age plus clock skew, then forgets them
+    nonce_store = NonceStore(ttl_seconds=360)
 
     print("Test 1: Valid recent message\n")
 
@@ -185,7 +186,7 @@ def demo_secure_message_flow():
     # Setup
     km = KeyManager()
     sender_key = km.generate_and_store("sender-agent")
-    nonce_store = set()
+    nonce_store = NonceStore()
 
     print("Step 1: Sender creates and signs message\n")
 
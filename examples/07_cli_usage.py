@@ -209,6 +209,14 @@ def demo_use_cases():
     print("done")
     print("```\n")
 
+    print("Or run the same commands in a single process (one interpreter start):")
+    print("```bash")
+    print("for i in {1..100}; do")
+    print('  echo "create --action ACT.QUERY.DATA --parameters \'{\\"id\\": $i}\' -o message_$i.json"')
+    print('  echo "sign message_$i.json --key batch-key -o signed_$i.json"')
+    print("done | pulse batch")
+    print("```\n")
+
     print("Use Case 2: Message Validation Pipeline\n")
     print("Validate and process incoming messages:")
     print("```bash")
@@ -5,16 +5,12 @@ Protocol for Universal Language-based System Exchange.
 Universal semantic protocol for AI-to-AI communication.
 """
 
+import importlib
+
 from pulse.version import __version__, __version_info__
 from pulse.message import PulseMessage
 from pulse.vocabulary import Vocabulary
 from pulse.validator import MessageValidator
-from pulse.encoder import Encoder, JSONEncoder, BinaryEncoder, CompactEncoder
-from pulse.security import SecurityManager, KeyManager
-from pulse.client import PulseClient
-from pulse.server import PulseServer
-from pulse.tls import TLSConfig, generate_self_signed_cert
-from pulse.adapter import PulseAdapter, AdapterError, AdapterConnectionError
 from pulse.exceptions import (
     PulseException,
     ValidationError,
@@ -26,6 +22,41 @@ from pulse.exceptions import (
     VocabularyError,
 )
 
+# Imported on first attribute access (PEP 562) so that `import pulse`
+# does not pay for msgpack, urllib, http.server and ssl up front.
+_LAZY = {
+    "Encoder": "pulse.encoder",
+    "JSONEncoder": "pulse.encoder",
+    "BinaryEncoder": "pulse.encoder",
+    "CompactEncoder": "pulse.encoder",
+    "SecurityManager": "pulse.security",
+    "KeyManager": "pulse.security",
+    "NonceStore": "pulse.security",
+    "PulseClient": "pulse.client",
+    "AsyncPulseClient": "pulse.async_client",
+    "PulseServer": "pulse.server",
+    "TLSConfig": "pulse.tls",
+    "TLSSessionCache": "pulse.tls",
+    "generate_self_signed_cert": "pulse.tls",
+    "PulseAdapter": "pulse.adapter",
+    "AdapterError": "pulse.adapter",
+    "AdapterConnectionError": "pulse.adapter",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     "__version__",
     "__version_info__",
@@ -38,9 +69,12 @@ __all__ = [
     "CompactEncoder",
     "SecurityManager",
     "KeyManager",
+    "NonceStore",
     "PulseClient",
+    "AsyncPulseClient",
     "PulseServer",
     "TLSConfig",
+    "TLSSessionCache",
     "generate_self_signed_cert",
     "PulseAdapter",
     "AdapterError",
@@ -19,10 +19,9 @@ Example:
     >>> response = adapter.send(request_message)
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List, Optional
 
-from pulse.message import PulseMessage
+from pulse.message import PulseMessage, _utc_timestamp
 from pulse.exceptions import NetworkError, PulseException
 
 
@@ -76,6 +75,9 @@ class PulseAdapter(ABC):
         base_url: Target service base URL
         connected: Whether the adapter has an active connection
 
+    The base class defines ``__slots__``. Subclasses get an instance
+    ``__dict__`` as usual unless they declare ``__slots__`` themselves.
+
     Example:
         >>> adapter = BinanceAdapter(api_key="...", api_secret="...")
         >>> order = PulseMessage(
@@ -86,6 +88,18 @@ class PulseAdapter(ABC):
         >>> print(result.content["parameters"]["status"])
     """
 
+    __slots__ = (
+        "_name",
+        "_sender_id",
+        "base_url",
+        "config",
+        "connected",
+        "_request_count",
+        "_error_count",
+        "_last_request_time",
+        "_supported_set",
+    )
+
     def __init__(
         self,
         name: str,
@@ -113,6 +127,17 @@ class PulseAdapter(ABC):
         self._request_count = 0
         self._error_count = 0
         self._last_request_time: Optional[str] = None
+        self._supported_set: Optional[FrozenSet[str]] = None
+
+    @property
+    def name(self) -> str:
+        """Adapter name; also sets the ``adapter:<name>`` response sender ID."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._sender_id = f"adapter:{value}"
 
     @abstractmethod
     def to_native(self, message: PulseMessage) -> Any:
@@ -203,9 +228,7 @@ class PulseAdapter(ABC):
             >>> response = adapter.send(request)
         """
         self._request_count += 1
-        self._last_request_time = (
-            datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        )
+        self._last_request_time = _utc_timestamp()
 
         try:
             native_request = self.to_native(message)
@@ -214,8 +237,9 @@ class PulseAdapter(ABC):
 
             # Set response envelope fields
             response.type = "RESPONSE"
-            response.envelope["receiver"] = message.envelope["sender"]
-            response.envelope["sender"] = f"adapter:{self.name}"
+            envelope = response.envelope
+            envelope["receiver"] = message.envelope["sender"]
+            envelope["sender"] = self._sender_id
 
             return response
 
@@ -264,18 +288,16 @@ class PulseAdapter(ABC):
             >>> status = adapter.health_check()
             >>> print(status["connected"])  # True/False
         """
+        requests = self._request_count
+        errors = self._error_count
         return {
             "adapter": self.name,
             "connected": self.connected,
             "base_url": self.base_url,
-            "requests": self._request_count,
-            "errors": self._error_count,
+            "requests": requests,
+            "errors": errors,
             "last_request": self._last_request_time,
-            "error_rate": (
-                self._error_count / self._request_count
-                if self._request_count > 0
-                else 0.0
-            ),
+            "error_rate": errors / (requests or 1),
         }
 
     @staticmethod
@@ -315,20 +337,24 @@ class PulseAdapter(ABC):
             ...     "Too many requests, retry after 60 seconds"
             ... )
         """
+        parameters = {
+            "error": error_message,
+            "adapter": self.name,
+        }
+        if original:
+            original_envelope = original.envelope
+            parameters["in_reply_to"] = original_envelope["message_id"]
+
         error_msg = PulseMessage(
             action=error_code,
-            parameters={
-                "error": error_message,
-                "adapter": self.name,
-            },
-            sender=f"adapter:{self.name}",
+            parameters=parameters,
+            sender=self._sender_id,
             validate=False,
         )
         error_msg.type = "ERROR"
 
         if original:
-            error_msg.envelope["receiver"] = original.envelope["sender"]
-            error_msg.content["parameters"]["in_reply_to"] = original.envelope["message_id"]
+            error_msg.envelope["receiver"] = original_envelope["sender"]
 
         return error_msg
 
@@ -337,6 +363,8 @@ class PulseAdapter(ABC):
         """Return list of PULSE actions this adapter supports.
 
         Override this property to declare which actions your adapter handles.
+        The list is read once, on the first ``supports()`` call, and cached
+        for the lifetime of the adapter.
 
         Returns:
             List of supported PULSE action concepts
@@ -360,10 +388,12 @@ class PulseAdapter(ABC):
             >>> adapter.supports("ACT.QUERY.DATA")
             True
         """
-        actions = self.supported_actions
-        if not actions:
+        supported = self._supported_set
+        if supported is None:
+            supported = self._supported_set = frozenset(self.supported_actions)
+        if not supported:
             return True  # Empty list means all actions accepted
-        return action in actions
+        return action in supported
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -0,0 +1,378 @@
+"""PULSE Protocol asyncio client.
+
+This module provides:
+- AsyncPulseClient: awaitable counterpart of PulseClient
+- Concurrent fan-out of many messages with send_many()
+- Optional HTTP/2 transport (pip install pulse-protocol[http2])
+
+By default requests run on a bounded thread pool over PulseClient's
+keep-alive connection pool, so the event loop never blocks on network
+I/O or retry backoff and no async HTTP dependency is required. With
+http2=True, messages are multiplexed as concurrent streams over one
+HTTP/2 connection using httpx.
+
+Example:
+    >>> async with AsyncPulseClient("https://agent-002.example.com") as client:
+    ...     response = await client.send(PulseMessage(action="ACT.QUERY.DATA"))
+    ...     responses = await client.send_many(messages)
+"""
+import asyncio
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pulse.client import PulseClient
+from pulse.message import PulseMessage
+from pulse.exceptions import NetworkError
+
+
+class AsyncPulseClient:
+    """
+    Asyncio client for sending and receiving PULSE messages.
+
+    Mirrors the PulseClient API with coroutine methods. Up to
+    max_concurrency requests are in flight at once, each on its own
+    pooled keep-alive connection, or as streams of a shared HTTP/2
+    connection when http2=True.
+
+    Attributes:
+        client: Underlying PulseClient (encoding, security, retries, stats)
+        max_concurrency: Maximum number of concurrent requests
+        http2: Whether messages are sent over HTTP/2 (httpx)
+
+    Example:
+        >>> client = AsyncPulseClient("https://agent-002.example.com", encoding="binary")
+        >>> response = await client.send(message)
+        >>> await client.aclose()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_concurrency: int = 10,
+        http2: bool = False,
+        **client_options: Any,
+    ) -> None:
+        """
+        Initialize async PULSE client.
+
+        Args:
+            base_url: Target server base URL (e.g., "https://agent.example.com")
+            max_concurrency: Maximum concurrent requests (default 10)
+            http2: Send messages over HTTP/2 with httpx (default False);
+                servers without HTTP/2 support are spoken to over HTTP/1.1
+            **client_options: Passed to PulseClient (agent_id, encoding,
+                security, timeout, max_retries, tls, ...)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1, or PulseClient
+                rejects the options
+            ImportError: If http2=True and httpx[http2] is not installed
+
+        Example:
+            >>> client = AsyncPulseClient("https://agent.example.com", http2=True)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = PulseClient(base_url, **client_options)
+        self.max_concurrency = max_concurrency
+        self.http2 = http2
+        self._http = self._create_http2_client(client_options) if http2 else None
+        # Caps concurrent HTTP/2 streams; created on first use because
+        # before Python 3.10 it binds to the event loop current at creation
+        self._http_slots: Optional[asyncio.Semaphore] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pulse-async"
+        )
+
+    def _create_http2_client(self, client_options: Dict[str, Any]) -> Any:
+        """
+        Create the httpx client used for HTTP/2 requests.
+
+        Args:
+            client_options: Options the PulseClient was created with
+
+        Returns:
+            httpx.AsyncClient with PulseClient's TLS settings and timeout
+
+        Raises:
+            ImportError: If httpx or its h2 extra is not installed
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401 - required by httpx for http2=True
+        except ImportError as e:
+            raise ImportError(
+                "http2=True requires httpx with HTTP/2 support: "
+                "pip install pulse-protocol[http2]"
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        return httpx.AsyncClient(
+            base_url=self.client.base_url,
+            http2=True,
+            verify=self._create_http2_ssl_context(client_options),
+            timeout=self.client.timeout,
+            limits=limits,
+        )
+
+    @staticmethod
+    def _create_http2_ssl_context(client_options: Dict[str, Any]) -> ssl.SSLContext:
+        """
+        Create a private SSL context for the httpx transport.
+
+        httpx sets ALPN protocols (h2) on the context it is given, so it
+        must not receive PulseClient's context: the default one is shared
+        by every client in the process, and http.client only speaks
+        HTTP/1.1.
+
+        Args:
+            client_options: Options the PulseClient was created with
+
+        Returns:
+            New SSL context with the same TLS settings as the PulseClient
+        """
+        verify = client_options.get("verify_ssl", True)
+        tls = client_options.get("tls")
+        if tls is not None:
+            return tls.create_client_context(
+                verify=verify,
+                client_certfile=client_options.get("client_certfile"),
+                client_keyfile=client_options.get("client_keyfile"),
+            )
+
+        context = ssl.create_default_context()
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    async def _post(self, path: str, data: bytes, headers: Dict[str, str]) -> Any:
+        """
+        POST over HTTP/2, with at most max_concurrency requests in flight.
+
+        httpx's connection limits don't bound the streams multiplexed
+        over one HTTP/2 connection, so the limit is applied here.
+
+        Args:
+            path: Request path, relative to base_url
+            data: Request body bytes
+            headers: HTTP headers
+
+        Returns:
+            httpx.Response
+        """
+        if self._http_slots is None:
+            self._http_slots = asyncio.Semaphore(self.max_concurrency)
+        async with self._http_slots:
+            return await self._http.post(path, content=data, headers=headers)
+
+    async def _post_with_retry(
+        self, path: str, data: bytes, headers: Dict[str, str]
+    ) -> bytes:
+        """
+        POST over HTTP/2 with the same retry policy as PulseClient.
+
+        Args:
+            path: Request path, relative to base_url
+            data: Request body bytes
+            headers: HTTP headers
+
+        Returns:
+            Response body bytes
+
+        Raises:
+            NetworkError: If all retries fail or the server rejects the request
+        """
+        import httpx
+
+        client = self.client
+        loop = asyncio.get_running_loop()
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(1, client.max_retries + 1):
+            started = loop.time()
+            try:
+                response = await self._post(path, data, headers)
+                status = response.status_code
+
+                if 200 <= status < 300:
+                    return response.content
+
+                # Redirects are not followed, as in PulseClient
+                if status < 400:
+                    raise NetworkError(
+                        f"Server returned {status}: redirect to "
+                        f"'{response.headers.get('location', '')}' not followed"
+                    )
+
+                # Don't retry client errors (4xx) except 429 (rate limit)
+                if status < 500 and status != 429:
+                    raise NetworkError(
+                        f"Server returned {status}: "
+                        f"{response.content.decode('utf-8', errors='replace')}"
+                    )
+
+                last_error = NetworkError(
+                    f"HTTP Error {status}: {response.reason_phrase}"
+                )
+                client._count(retries_total=1)
+
+            except httpx.HTTPError as e:
+                last_error = e
+                client._count(retries_total=1)
+
+            if attempt < client.max_retries:
+                remaining = started + client._compute_backoff(attempt) - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+        client._count(messages_failed=1)
+        raise NetworkError(
+            f"Failed after {client.max_retries} attempts: {last_error}"
+        ) from last_error
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client call on the worker pool and await it."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def send(
+        self,
+        message: PulseMessage,
+        path: str = "/pulse/v1/messages",
+        receiver: Optional[str] = None,
+    ) -> PulseMessage:
+        """
+        Send a PULSE message and await the response.
+
+        Args:
+            message: PulseMessage to send
+            path: API endpoint path (default "/pulse/v1/messages")
+            receiver: Optional receiver agent ID to set in envelope
+
+        Returns:
+            PulseMessage response from the server
+
+        Raises:
+            NetworkError: If request fails after all retries
+            SecurityError: If response signature verification fails
+            TimeoutError: If request times out
+        """
+        if self._http is None:
+            return await self._run(self.client.send, message, path, receiver)
+
+        data, headers = self.client._prepare(message, receiver, expect_response=True)
+        body = await self._post_with_retry(path, data, headers)
+        return self.client._complete(data, body)
+
+    async def send_many(
+        self,
+        messages: Iterable[PulseMessage],
+        path: str = "/pulse/v1/messages",
+        receiver: Optional[str] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send many PULSE messages concurrently.
+
+        Args:
+            messages: PulseMessages to send
+            path: API endpoint path (default "/pulse/v1/messages")
+            receiver: Optional receiver agent ID to set in every envelope
+            return_exceptions: Return failures in place of their responses
+                instead of raising the first one (default False)
+
+        Returns:
+            Responses in the same order as messages
+
+        Example:
+            >>> responses = await client.send_many(messages, return_exceptions=True)
+            >>> failed = [r for r in responses if isinstance(r, Exception)]
+        """
+        return await asyncio.gather(
+            *(self.send(message, path, receiver) for message in messages),
+            return_exceptions=return_exceptions,
+        )
+
+    async def send_fire_and_forget(
+        self,
+        message: PulseMessage,
+        path: str = "/pulse/v1/messages",
+        receiver: Optional[str] = None,
+    ) -> bool:
+        """
+        Send a PULSE message without waiting for a structured response.
+
+        Args:
+            message: PulseMessage to send
+            path: API endpoint path
+            receiver: Optional receiver agent ID
+
+        Returns:
+            True if message was accepted (2xx status), False otherwise
+        """
+        if self._http is None:
+            return await self._run(self.client.send_fire_and_forget, message, path, receiver)
+
+        data, headers = self.client._prepare(message, receiver, expect_response=False)
+        try:
+            response = await self._post(path, data, headers)
+        except Exception:
+            self.client._count(messages_failed=1)
+            return False
+
+        if 200 <= response.status_code < 300:
+            self.client._count(messages_sent=1, bytes_sent=len(data))
+            return True
+        self.client._count(messages_failed=1)
+        return False
+
+    async def ping(self, path: str = "/pulse/v1/health") -> Dict[str, Any]:
+        """
+        Check if the target server is reachable and healthy.
+
+        Always uses PulseClient's HTTP/1.1 connection pool.
+
+        Args:
+            path: Health check endpoint path
+
+        Returns:
+            Dictionary with health status and latency
+        """
+        return await self._run(self.client.ping, path)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get client statistics (see PulseClient.stats)."""
+        return self.client.stats
+
+    async def aclose(self) -> None:
+        """Wait for in-flight requests, stop the worker pool and close connections."""
+        if self._http is not None:
+            await self._http.aclose()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self._executor.shutdown, wait=True))
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncPulseClient":
+        """Return the client for use in an async with statement."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the client on leaving the async with block."""
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        """Return string representation of client."""
+        return (
+            f"AsyncPulseClient(base_url='{self.client.base_url}', "
+            f"encoding='{self.client.encoding}', "
+            f"max_concurrency={self.max_concurrency}"
+            f"{', http2=True' if self.http2 else ''})"
+        )
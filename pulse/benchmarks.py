@@ -8,8 +8,16 @@ Comprehensive performance testing suite for:
 - Validation
 - Vocabulary operations
 """
+import io
+import math
+import os
 import time
-from typing import Dict, Any, Callable
+import timeit
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+from typing import Dict, Any, Callable, Optional, Set, Tuple, Type
 import statistics
 
 from pulse import (
@@ -33,6 +41,7 @@ class BenchmarkResult:
         self.name = name
         self.times = []
         self.iterations = 0
+        self.total_time = 0.0
 
     def add_time(self, duration: float):
         """Add a timing measurement.
@@ -42,6 +51,18 @@ class BenchmarkResult:
         """
         self.times.append(duration)
         self.iterations += 1
+        self.total_time += duration
+
+    def add_batch(self, duration: float, number: int):
+        """Add a timing measurement covering several calls.
+
+        Args:
+            duration: Duration of the whole batch in seconds
+            number: Number of calls in the batch
+        """
+        self.times.append(duration / number)
+        self.iterations += number
+        self.total_time += duration
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistical summary.
@@ -49,19 +70,29 @@ class BenchmarkResult:
         Returns:
             Dictionary with mean, median, min, max, std
         """
-        if not self.times:
+        times = self.times
+        if not times:
             return {}
 
+        # Sample stdev with float arithmetic; statistics.stdev() computes it
+        # exactly with Fractions, which is needlessly slow here
+        stdev = 0
+        if len(times) > 1:
+            sample_mean = math.fsum(times) / len(times)
+            stdev = math.sqrt(
+                math.fsum((t - sample_mean) ** 2 for t in times) / (len(times) - 1)
+            )
+
         return {
             'name': self.name,
             'iterations': self.iterations,
-            'total_time': sum(self.times),
-            'mean': statistics.mean(self.times),
-            'median': statistics.median(self.times),
-            'min': min(self.times),
-            'max': max(self.times),
-            'stdev': statistics.stdev(self.times) if len(self.times) > 1 else 0,
-            'ops_per_sec': self.iterations / sum(self.times) if sum(self.times) > 0 else 0,
+            'total_time': self.total_time,
+            'mean': self.total_time / self.iterations,
+            'median': statistics.median(times),
+            'min': min(times),
+            'max': max(times),
+            'stdev': stdev,
+            'ops_per_sec': self.iterations / self.total_time if self.total_time > 0 else 0,
         }
 
     def __str__(self) -> str:
@@ -86,18 +117,47 @@ class BenchmarkResult:
 class PerformanceBenchmarks:
     """Performance benchmarks for PULSE Protocol."""
 
-    def __init__(self, iterations: int = 1000):
+    # Independent benchmark groups, in run_all() order
+    GROUPS = (
+        "benchmark_message_creation",
+        "benchmark_json_encoding",
+        "benchmark_binary_encoding",
+        "benchmark_batch_encoding",
+        "benchmark_security",
+        "benchmark_validation",
+        "benchmark_vocabulary",
+        "benchmark_encoder_comparison",
+    )
+
+    def __init__(
+        self,
+        iterations: int = 1000,
+        cpu_time: bool = False,
+        pin_cpu: Optional[int] = None,
+    ):
         """Initialize benchmarks.
 
         Args:
             iterations: Number of iterations per benchmark
+            cpu_time: Measure thread CPU time instead of wall-clock time,
+                so time spent descheduled by the OS is not counted
+            pin_cpu: CPU to pin the process to during run_all() (Linux
+                only), restoring the previous affinity afterwards
         """
         self.iterations = iterations
+        self.cpu_time = cpu_time
+        self.pin_cpu = pin_cpu
         self.results = {}
 
     def benchmark(self, name: str, func: Callable, *args, **kwargs) -> BenchmarkResult:
         """Run a benchmark.
 
+        Calls are timed by ``timeit`` in batches of ``iterations // 100``
+        (at least 1) so that timer overhead does not dominate sub-microsecond
+        operations; each sample in the result is the mean per-call duration
+        of one batch. A final, smaller batch makes up the remainder, so
+        exactly ``iterations`` calls are timed.
+
         Args:
             name: Benchmark name
             func: Function to benchmark
@@ -106,19 +166,31 @@ class PerformanceBenchmarks:
 
         Returns:
             BenchmarkResult with timing data
+
+        Raises:
+            ValueError: If iterations is less than 1
         """
+        if self.iterations < 1:
+            raise ValueError(f"iterations must be at least 1, got {self.iterations}")
+
         result = BenchmarkResult(name)
+        # Call zero-argument callables directly; a partial adds a call layer
+        call = partial(func, *args, **kwargs) if args or kwargs else func
 
         # Warmup
         for _ in range(min(10, self.iterations // 10)):
-            func(*args, **kwargs)
-
-        # Actual benchmark
-        for _ in range(self.iterations):
-            start = time.perf_counter()
-            func(*args, **kwargs)
-            duration = time.perf_counter() - start
-            result.add_time(duration)
+            call()
+
+        # Actual benchmark; keep GC enabled like in real use. Batches are
+        # timed in integer nanoseconds so tiny batches keep full precision.
+        number = max(1, self.iterations // 100)
+        clock = time.thread_time_ns if self.cpu_time else time.perf_counter_ns
+        timer = timeit.Timer(call, setup="gc.enable()", timer=clock)
+        repeat, remainder = divmod(self.iterations, number)
+        for duration_ns in timer.repeat(repeat=repeat, number=number):
+            result.add_batch(duration_ns / 1e9, number)
+        if remainder:
+            result.add_batch(timer.timeit(number=remainder) / 1e9, remainder)
 
         self.results[name] = result
         return result
@@ -183,11 +255,9 @@ class PerformanceBenchmarks:
         )
         print(result)
 
-        # JSON roundtrip
+        # JSON roundtrip (encode + decode of the same message)
         def json_roundtrip():
-            msg = PulseMessage(action="ACT.QUERY.DATA", validate=False)
-            json_str = msg.to_json(indent=None)
-            return PulseMessage.from_json(json_str)
+            return PulseMessage.from_json(message.to_json(indent=None))
 
         result = self.benchmark("JSON roundtrip", json_roundtrip)
         print(result)
@@ -218,15 +288,39 @@ class PerformanceBenchmarks:
         )
         print(result)
 
-        # Binary roundtrip
+        # Binary roundtrip (encode + decode of the same message)
         def binary_roundtrip():
-            msg = PulseMessage(action="ACT.QUERY.DATA", validate=False)
-            binary = msg.to_binary()
-            return PulseMessage.from_binary(binary)
+            return PulseMessage.from_binary(message.to_binary())
 
         result = self.benchmark("Binary roundtrip", binary_roundtrip)
         print(result)
 
+    def benchmark_batch_encoding(self):
+        """Benchmark encoding 100 messages one by one vs. as a batch."""
+        print("\n=== Batch Encoding (100 messages) ===")
+
+        encoder = Encoder()
+        messages = [
+            PulseMessage(
+                action="ACT.QUERY.DATA",
+                parameters={"query": "test", "index": i},
+                validate=False
+            )
+            for i in range(100)
+        ]
+
+        result = self.benchmark(
+            "Binary encode x100 (loop)",
+            lambda: [encoder.encode(m, format="binary") for m in messages]
+        )
+        print(result)
+
+        result = self.benchmark(
+            "Binary encode x100 (batch)",
+            lambda: encoder.encode_batch(messages, format="binary")
+        )
+        print(result)
+
     def benchmark_security(self):
         """Benchmark security operations."""
         print("\n=== Security Operations ===")
@@ -332,10 +426,42 @@ class PerformanceBenchmarks:
         print(f"    JSON:   {sizes['json']} bytes")
         print(f"    Binary: {sizes['binary']} bytes")
         print(f"    Reduction: {sizes['binary_reduction']}×")
-        print(f"    Savings: {sizes['savings_percent']}%")
+        print(f"    Savings: {sizes['binary_savings_percent']}%")
 
-    def run_all(self):
-        """Run all benchmarks."""
+    def run_all(self, workers: int = 1):
+        """Run all benchmarks.
+
+        Args:
+            workers: Number of processes to run benchmark groups in. Groups
+                running side by side compete for CPU and cache, so use more
+                than 1 for quick sweeps, not for numbers to compare.
+
+        Raises:
+            ValueError: If pin_cpu is set and workers is greater than 1
+        """
+        if self.pin_cpu is not None and workers > 1:
+            raise ValueError("pin_cpu cannot be combined with workers > 1")
+
+        previous_affinity = self._pin()
+        try:
+            self._run_all(workers)
+        finally:
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+
+    def _pin(self) -> Optional[Set[int]]:
+        """Pin the process to self.pin_cpu; return the affinity to restore."""
+        if self.pin_cpu is None:
+            return None
+        if not hasattr(os, "sched_setaffinity"):
+            warnings.warn("CPU pinning is not supported on this platform", RuntimeWarning)
+            return None
+        previous = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {self.pin_cpu})
+        return previous
+
+    def _run_all(self, workers: int):
+        """Run all benchmark groups and print the summary."""
         print("=" * 70)
         print("  PULSE Protocol Performance Benchmarks")
         print(f"  Iterations per test: {self.iterations}")
@@ -343,13 +469,20 @@ class PerformanceBenchmarks:
 
         start_time = time.time()
 
-        self.benchmark_message_creation()
-        self.benchmark_json_encoding()
-        self.benchmark_binary_encoding()
-        self.benchmark_security()
-        self.benchmark_validation()
-        self.benchmark_vocabulary()
-        self.benchmark_encoder_comparison()
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_group, type(self), self.iterations, self.cpu_time, group)
+                    for group in self.GROUPS
+                ]
+                # Print each group's output whole and in the usual order
+                for future in futures:
+                    output, results = future.result()
+                    print(output, end="")
+                    self.results.update(results)
+        else:
+            for group in self.GROUPS:
+                getattr(self, group)()
 
         total_time = time.time() - start_time
 
@@ -369,24 +502,49 @@ class PerformanceBenchmarks:
         }
 
 
-def run_benchmarks(iterations: int = 1000):
+def _run_group(
+    cls: Type[PerformanceBenchmarks], iterations: int, cpu_time: bool, group: str
+) -> Tuple[str, Dict[str, BenchmarkResult]]:
+    """Run one benchmark group in a worker process.
+
+    Returns:
+        Tuple of (printed output, results)
+    """
+    benchmarks = cls(iterations=iterations, cpu_time=cpu_time)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        getattr(benchmarks, group)()
+    return output.getvalue(), benchmarks.results
+
+
+def run_benchmarks(
+    iterations: int = 1000,
+    workers: int = 1,
+    cpu_time: bool = False,
+    pin_cpu: Optional[int] = None,
+):
     """Run performance benchmarks.
 
     Args:
         iterations: Number of iterations per benchmark
+        workers: Number of processes to run benchmark groups in
+        cpu_time: Measure thread CPU time instead of wall-clock time
+        pin_cpu: CPU to pin the process to while benchmarking (Linux only)
 
     Returns:
         PerformanceBenchmarks instance with results
     """
-    benchmarks = PerformanceBenchmarks(iterations=iterations)
-    benchmarks.run_all()
+    benchmarks = PerformanceBenchmarks(
+        iterations=iterations, cpu_time=cpu_time, pin_cpu=pin_cpu
+    )
+    benchmarks.run_all(workers=workers)
     return benchmarks
 
 
 if __name__ == '__main__':
     import sys
 
-    # Get iterations from command line
+    # Get iterations (and optionally worker processes) from command line
     iterations = 1000
     if len(sys.argv) > 1:
         try:
@@ -394,4 +552,11 @@ if __name__ == '__main__':
         except ValueError:
             print(f"Invalid iterations: {sys.argv[1]}, using default: 1000")
 
-    run_benchmarks(iterations=iterations)
+    workers = 1
+    if len(sys.argv) > 2:
+        try:
+            workers = int(sys.argv[2])
+        except ValueError:
+            print(f"Invalid workers: {sys.argv[2]}, using default: 1")
+
+    run_benchmarks(iterations=iterations, workers=workers)
@@ -8,18 +8,22 @@ Usage:
     pulse sign message.json --key my-secret-key
     pulse verify message.json --key my-secret-key
     pulse encode message.json --format binary
+    pulse encode message.json --format compact
     pulse decode message.bin --format binary
+    pulse batch commands.txt
 """
 import argparse
+import mmap
+import os
+import shlex
 import sys
 import json
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Union
 from pathlib import Path
 
 from pulse import (
     PulseMessage,
-    SecurityManager,
-    Encoder,
     ValidationError,
     EncodingError,
     DecodingError,
@@ -27,6 +31,50 @@ from pulse import (
 )
 
 
+# Input files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+
+@contextmanager
+def _read_input(path: str) -> Iterator[Union[bytes, memoryview]]:
+    """Yield a file's contents, memory-mapping large files to avoid a copy.
+
+    The memoryview is only valid inside the ``with`` block.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # A decode error's traceback still holds a slice; GC unmaps
+
+
+def _message_json(message: PulseMessage, indent: Optional[int]) -> bytes:
+    """Serialize a message to UTF-8 JSON bytes for writing to a file."""
+    from pulse.encoder import JSONEncoder
+
+    return JSONEncoder.encode(message, indent=indent)
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write UTF-8 bytes and a newline to stdout in a single write."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:  # e.g. stdout redirected to a StringIO
+        print(data.decode('utf-8'))
+        return
+    sys.stdout.flush()  # keep order with earlier print() output
+    buffer.write(data + b'\n')
+
+
 def create_message_command(args) -> int:
     """Create a new PULSE message.
 
@@ -56,13 +104,13 @@ def create_message_command(args) -> int:
         )
 
         # Output
-        output = message.to_json(indent=args.indent)
+        output = _message_json(message, args.indent)
 
         if args.output:
-            Path(args.output).write_text(output, encoding='utf-8')
+            Path(args.output).write_bytes(output)
             print(f"Message created: {args.output}")
         else:
-            print(output)
+            _write_stdout(output)
 
         return 0
 
@@ -85,8 +133,8 @@ def validate_message_command(args) -> int:
     """
     try:
         # Read message
-        content = Path(args.file).read_text(encoding='utf-8')
-        message = PulseMessage.from_json(content)
+        with _read_input(args.file) as content:
+            message = PulseMessage.from_json(content)
 
         # Validate
         message.validate(check_freshness=args.check_freshness)
@@ -118,9 +166,11 @@ def sign_message_command(args) -> int:
     Returns:
         Exit code (0 for success)
     """
+    from pulse.security import SecurityManager
+
     try:
         # Read message
-        content = Path(args.file).read_text(encoding='utf-8')
+        content = Path(args.file).read_bytes()
         message = PulseMessage.from_json(content)
 
         # Sign
@@ -128,13 +178,13 @@ def sign_message_command(args) -> int:
         signature = security.sign_message(message)
 
         # Output
-        output = message.to_json(indent=args.indent)
+        output = _message_json(message, args.indent)
 
         if args.output:
-            Path(args.output).write_text(output, encoding='utf-8')
+            Path(args.output).write_bytes(output)
             print(f"✓ Message signed: {args.output}")
         else:
-            print(output)
+            _write_stdout(output)
 
         print(f"  Signature: {signature[:32]}...", file=sys.stderr)
 
@@ -157,9 +207,11 @@ def verify_signature_command(args) -> int:
     Returns:
         Exit code (0 for success, 1 for invalid signature)
     """
+    from pulse.security import SecurityManager
+
     try:
         # Read message
-        content = Path(args.file).read_text(encoding='utf-8')
+        content = Path(args.file).read_bytes()
         message = PulseMessage.from_json(content)
 
         # Verify
@@ -192,9 +244,11 @@ def encode_message_command(args) -> int:
     Returns:
         Exit code (0 for success)
     """
+    from pulse.encoder import Encoder
+
     try:
         # Read message
-        content = Path(args.file).read_text(encoding='utf-8')
+        content = Path(args.file).read_bytes()
         message = PulseMessage.from_json(content)
 
         # Encode
@@ -216,6 +270,14 @@ def encode_message_command(args) -> int:
             print(f"✓ Encoded to JSON: {output_file}")
             print(f"  Size: {len(encoded)} bytes")
 
+        elif args.format == 'compact':
+            encoded = encoder.encode(message, format='compact')
+            output_file = args.output or (args.file.rsplit('.', 1)[0] + '.pulse')
+            Path(output_file).write_bytes(encoded)
+
+            print(f"✓ Encoded to compact binary: {output_file}")
+            print(f"  Size: {len(encoded)} bytes")
+
         # Show size comparison
         if args.compare:
             sizes = encoder.get_size_comparison(message)
@@ -245,27 +307,27 @@ def decode_message_command(args) -> int:
     Returns:
         Exit code (0 for success)
     """
-    try:
-        # Read encoded data
-        data = Path(args.file).read_bytes()
+    from pulse.encoder import Encoder
 
+    try:
         # Decode
         encoder = Encoder()
 
-        if args.format:
-            message = encoder.decode(data, format=args.format)
-        else:
-            # Auto-detect
-            message = encoder.decode(data)
+        with _read_input(args.file) as data:
+            if args.format:
+                message = encoder.decode(data, format=args.format)
+            else:
+                # Auto-detect
+                message = encoder.decode(data)
 
         # Output
-        output = message.to_json(indent=args.indent)
+        output = _message_json(message, args.indent)
 
         if args.output:
-            Path(args.output).write_text(output, encoding='utf-8')
+            Path(args.output).write_bytes(output)
             print(f"✓ Decoded to: {args.output}")
         else:
-            print(output)
+            _write_stdout(output)
 
         return 0
 
@@ -280,8 +342,75 @@ def decode_message_command(args) -> int:
         return 1
 
 
-def main():
-    """Main CLI entry point."""
+def batch_command(args) -> int:
+    """Run many CLI commands in one process.
+
+    Reads one command per line (e.g. ``sign m1.json --key k -o s1.json``)
+    and runs each through the same parser and handlers as ``pulse`` itself,
+    so a batch pays interpreter startup and imports only once. Blank lines
+    and lines starting with ``#`` are skipped.
+
+    Args:
+        args: Command arguments
+
+    Returns:
+        Exit code (0 if every command succeeded)
+    """
+    try:
+        if args.file == '-':
+            failures = _run_batch(sys.stdin, args.fail_fast)
+        else:
+            with open(args.file, encoding='utf-8') as f:
+                failures = _run_batch(f, args.fail_fast)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        return 1
+
+    if failures:
+        print(f"{failures} command(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _run_batch(lines, fail_fast: bool) -> int:
+    """Run each command line through main(); return the number of failures."""
+    parser = build_parser()
+    failures = 0
+
+    for lineno, line in enumerate(lines, 1):
+        if line.lstrip().startswith('#'):
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Line {lineno}: {e}", file=sys.stderr)
+            code = 1
+        else:
+            if not argv:
+                continue
+            if argv[0] == 'batch':
+                print(f"Line {lineno}: batch cannot be nested", file=sys.stderr)
+                code = 1
+            else:
+                try:
+                    code = main(argv, parser=parser)
+                except SystemExit as e:  # argparse usage errors
+                    code = e.code
+
+        if code:
+            failures += 1
+            if fail_fast:
+                break
+
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``pulse`` command.
+
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         prog='pulse',
         description='PULSE Protocol CLI - Create, validate, sign, and encode messages',
@@ -306,6 +435,9 @@ Examples:
   # Decode from binary
   pulse decode message.bin --format binary -o decoded.json
 
+  # Run one command per line in a single process
+  pulse batch commands.txt
+
 For more information, visit: https://github.com/pulse-protocol/pulse-python
         """
     )
@@ -321,6 +453,10 @@ For more information, visit: https://github.com/pulse-protocol/pulse-python
     create_parser.add_argument('--no-validate', action='store_true', help='Skip validation')
     create_parser.add_argument('-o', '--output', help='Output file (default: stdout)')
     create_parser.add_argument('--indent', type=int, default=2, help='JSON indentation (default: 2)')
+    create_parser.add_argument(
+        '--compact', dest='indent', action='store_const', const=None,
+        help='Single-line JSON without whitespace (fastest)'
+    )
 
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate a PULSE message')
@@ -333,6 +469,10 @@ For more information, visit: https://github.com/pulse-protocol/pulse-python
     sign_parser.add_argument('--key', required=True, help='Secret key for signing')
     sign_parser.add_argument('-o', '--output', help='Output file (default: overwrite input)')
     sign_parser.add_argument('--indent', type=int, default=2, help='JSON indentation (default: 2)')
+    sign_parser.add_argument(
+        '--compact', dest='indent', action='store_const', const=None,
+        help='Single-line JSON without whitespace (fastest)'
+    )
 
     # Verify command
     verify_parser = subparsers.add_parser('verify', help='Verify message signature')
@@ -342,18 +482,48 @@ For more information, visit: https://github.com/pulse-protocol/pulse-python
     # Encode command
     encode_parser = subparsers.add_parser('encode', help='Encode message to binary format')
     encode_parser.add_argument('file', help='Message file to encode')
-    encode_parser.add_argument('--format', choices=['binary', 'json'], default='binary', help='Output format')
+    encode_parser.add_argument(
+        '--format', choices=['binary', 'json', 'compact'], default='binary',
+        help='Output format (binary: MessagePack; compact: smallest, but IDs and sender are stored as hashes)'
+    )
     encode_parser.add_argument('-o', '--output', help='Output file (default: auto)')
     encode_parser.add_argument('--compare', action='store_true', help='Show size comparison')
 
     # Decode command
     decode_parser = subparsers.add_parser('decode', help='Decode message from binary')
     decode_parser.add_argument('file', help='Encoded file to decode')
-    decode_parser.add_argument('--format', choices=['binary', 'json'], help='Input format (default: auto-detect)')
+    decode_parser.add_argument(
+        '--format', choices=['binary', 'json', 'compact'],
+        help='Input format (binary: MessagePack; default: auto-detect)'
+    )
     decode_parser.add_argument('-o', '--output', help='Output file (default: stdout)')
     decode_parser.add_argument('--indent', type=int, default=2, help='JSON indentation (default: 2)')
+    decode_parser.add_argument(
+        '--compact', dest='indent', action='store_const', const=None,
+        help='Single-line JSON without whitespace (fastest)'
+    )
+
+    # Batch command
+    batch_parser = subparsers.add_parser('batch', help='Run commands from a file, one per line')
+    batch_parser.add_argument('file', nargs='?', default='-', help='Command file (default: stdin)')
+    batch_parser.add_argument('--fail-fast', action='store_true', help='Stop at the first failing command')
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, parser: Optional[argparse.ArgumentParser] = None) -> int:
+    """Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        parser: Parser to reuse (default: a new one from build_parser())
+
+    Returns:
+        Exit code
+    """
+    if parser is None:
+        parser = build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -367,6 +537,7 @@ For more information, visit: https://github.com/pulse-protocol/pulse-python
         'verify': verify_signature_command,
         'encode': encode_message_command,
         'decode': decode_message_command,
+        'batch': batch_command,
     }
 
     handler = commands.get(args.command)
@@ -5,7 +5,7 @@ This module provides:
 - Automatic retry with exponential backoff
 - Message signing and verification
 - Support for JSON and Binary encoding formats
-- Connection pooling and timeout management
+- Persistent (keep-alive) connections and timeout management
 
 Example:
     >>> client = PulseClient(base_url="https://agent-002.example.com")
@@ -13,18 +13,160 @@ Example:
     >>> response = client.send(message)
     >>> print(response.content)
 """
-import json
+import base64
+import http.client
+import queue
+import random
+import select
 import ssl
+import threading
 import time
 import urllib.request
-import urllib.error
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+from urllib.parse import unquote, urlsplit
 
 from pulse.message import PulseMessage
 from pulse.security import SecurityManager
-from pulse.encoder import JSONEncoder, BinaryEncoder
+from pulse.encoder import JSONEncoder, BinaryEncoder, _JSON_FIRST_BYTES
 from pulse.exceptions import NetworkError, SecurityError, TimeoutError
+from pulse.tls import TLSSessionCache
+
+# Errors raised when a kept-alive connection was closed by the server
+# between requests; idempotent requests are replayed once on a fresh
+# connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionError,
+)
+
+# Methods that are safe to replay when the server may have seen them
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Headers for ping(); shared by all calls and never modified
+_PING_HEADERS = {"X-PULSE-Version": "1.0"}
+
+# SSL contexts shared by clients without TLSConfig, keyed by verify_ssl.
+# Built on first use: loading the system CA bundle is the slow part.
+_DEFAULT_SSL_CONTEXTS: Dict[bool, ssl.SSLContext] = {}
+_DEFAULT_SSL_CONTEXTS_LOCK = threading.Lock()
+
+
+def _default_ssl_context(verify: bool) -> ssl.SSLContext:
+    """
+    Return the shared default SSL context.
+
+    Args:
+        verify: Whether certificates and hostnames are verified
+
+    Returns:
+        SSL context created once per process for each verify setting
+    """
+    context = _DEFAULT_SSL_CONTEXTS.get(verify)
+    if context is None:
+        with _DEFAULT_SSL_CONTEXTS_LOCK:
+            context = _DEFAULT_SSL_CONTEXTS.get(verify)
+            if context is None:
+                context = ssl.create_default_context()
+                if not verify:
+                    context.check_hostname = False
+                    context.verify_mode = ssl.CERT_NONE
+                _DEFAULT_SSL_CONTEXTS[verify] = context
+    return context
+
+
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """
+    Check whether an idle keep-alive connection can still be used.
+
+    An idle connection has nothing left to read, so a readable socket
+    means the server has closed it (or sent something unexpected).
+
+    Args:
+        conn: Idle connection taken from the pool
+
+    Returns:
+        True if the connection must not be reused
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+    except (OSError, ValueError):
+        return True
+
+
+def _find_proxy(scheme: str, host: str) -> Optional[Tuple[str, int, Dict[str, str]]]:
+    """
+    Look up the proxy configured for a URL, as urllib.request does.
+
+    Honours the HTTP_PROXY / HTTPS_PROXY and NO_PROXY environment
+    variables (and the system settings on macOS and Windows).
+
+    Args:
+        scheme: URL scheme ("http" or "https")
+        host: Target host name
+
+    Returns:
+        Tuple of (proxy_host, proxy_port, proxy_headers), or None to
+        connect directly
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+
+    parts = urlsplit(proxy)
+    headers: Dict[str, str] = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return parts.hostname, port, headers
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes TLS sessions from a TLSSessionCache."""
+
+    def __init__(
+        self, host: str, port: Optional[int], session_cache: TLSSessionCache, **kwargs: Any
+    ) -> None:
+        super().__init__(host, port, **kwargs)
+        self._session_cache = session_cache
+        self._session_key = (host, self.port)
+
+    def connect(self) -> None:
+        """Connect, offering the cached session for this host if any."""
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        if self._tunnel_host:
+            # Through a proxy tunnel: key sessions by the real server
+            self._session_key = (self._tunnel_host, self._tunnel_port)
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=server_hostname,
+            session=self._session_cache.get(self._session_key),
+        )
+
+    def getresponse(self) -> http.client.HTTPResponse:
+        """Read the response and cache the TLS session it was sent on."""
+        sock = self.sock
+        response = super().getresponse()
+        # TLS 1.3 session tickets arrive after the handshake, so the
+        # session is only complete once the response has been read.
+        session = sock.session if sock is not None else None
+        if session is not None:
+            self._session_cache.put(self._session_key, session)
+        return response
 
 
 class PulseClient:
@@ -35,6 +177,10 @@ class PulseClient:
     automatic message signing, retry logic with exponential backoff,
     and TLS verification.
 
+    Connections to the server are kept alive and reused across
+    requests; call close() (or use the client as a context manager)
+    to release them.
+
     Attributes:
         base_url: Target server URL
         encoding: Message encoding format ("json" or "binary")
@@ -55,6 +201,10 @@ class PulseClient:
         ...     encoding="binary"
         ... )
         >>> response = client.send(message)
+
+        >>> # Release pooled connections when done
+        >>> with PulseClient("https://agent-002.example.com") as client:
+        ...     response = client.send(message)
     """
 
     def __init__(
@@ -66,10 +216,17 @@ class PulseClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.25,
         verify_ssl: bool = True,
         tls: Optional["TLSConfig"] = None,
         client_certfile: Optional[str] = None,
         client_keyfile: Optional[str] = None,
+        tls_session_cache_enabled: bool = True,
+        tls_session_cache_size: int = 100,
+        tls_session_cache_ttl: float = 300.0,
+        background_workers: int = 2,
+        background_queue_size: int = 1000,
     ) -> None:
         """
         Initialize PULSE client.
@@ -82,13 +239,21 @@ class PulseClient:
             timeout: Request timeout in seconds (default 30)
             max_retries: Maximum retry attempts for transient failures (default 3)
             retry_base_delay: Base delay in seconds for exponential backoff (default 1.0)
+            retry_max_delay: Upper bound in seconds for one backoff delay before jitter (default 30)
+            retry_jitter: Random spread applied to each delay, as a fraction (default 0.25 = ±25%)
             verify_ssl: Whether to verify SSL certificates (default True)
             tls: TLSConfig for advanced TLS settings (overrides verify_ssl)
             client_certfile: Path to client certificate for mTLS
             client_keyfile: Path to client private key for mTLS
+            tls_session_cache_enabled: Resume TLS sessions on reconnect (default True)
+            tls_session_cache_size: Maximum cached TLS sessions (default 100)
+            tls_session_cache_ttl: Seconds a TLS session is reused (default 300)
+            background_workers: Threads sending queued fire-and-forget messages (default 2)
+            background_queue_size: Maximum queued fire-and-forget messages (default 1000)
 
         Raises:
-            ValueError: If encoding format is not supported
+            ValueError: If encoding format is not supported or base_url
+                is not an http(s) URL
 
         Example:
             >>> client = PulseClient("https://agent-002.example.com")
@@ -115,9 +280,35 @@ class PulseClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
         self.verify_ssl = verify_ssl
         self.tls = tls
 
+        # Parse base URL once for the persistent connections. A query
+        # string on base_url is sent after the request path.
+        parts = urlsplit(self.base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid base URL: '{base_url}'")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._base_path = parts.path
+        self._query = f"?{parts.query}" if parts.query else ""
+
+        # Proxy from the environment, as urllib.request would use. HTTPS
+        # is tunnelled with CONNECT; plain HTTP requests go to the proxy
+        # with an absolute URL.
+        self._proxy = _find_proxy(self._scheme, self._host)
+        self._target_prefix = self._base_path
+        if self._proxy is not None and self._scheme == "http":
+            netloc = parts.netloc.rpartition("@")[2]
+            self._target_prefix = f"http://{netloc}{self._base_path}"
+
+        # Idle keep-alive connections, shared between threads
+        self._idle: List[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+
         # SSL context - use TLSConfig if provided, otherwise basic
         if tls is not None:
             self._ssl_context = tls.create_client_context(
@@ -128,6 +319,25 @@ class PulseClient:
         else:
             self._ssl_context = self._create_ssl_context()
 
+        # TLS sessions for resumption when connections are reopened
+        self._tls_sessions: Optional[TLSSessionCache] = None
+        if tls_session_cache_enabled and self._scheme == "https":
+            self._tls_sessions = TLSSessionCache(
+                maxsize=tls_session_cache_size, ttl=tls_session_cache_ttl
+            )
+
+        # Background senders for send_fire_and_forget(wait=False), started on first use
+        self.background_workers = background_workers
+        self.background_queue_size = background_queue_size
+        self._bg_queue: Optional[queue.Queue] = None
+        self._bg_threads: List[threading.Thread] = []
+        self._bg_lock = threading.Lock()
+        self._bg_closed = False
+
+        # Request headers, rebuilt only when encoding or agent_id change
+        self._headers_key: Optional[Tuple[str, str, str]] = None
+        self._headers: Tuple[Dict[str, str], Dict[str, str]] = ({}, {})
+
         # Stats tracking
         self._stats = {
             "messages_sent": 0,
@@ -136,19 +346,191 @@ class PulseClient:
             "bytes_sent": 0,
             "bytes_received": 0,
         }
+        self._stats_lock = threading.Lock()
+        self._stats_view = MappingProxyType(self._stats)
 
     def _create_ssl_context(self) -> ssl.SSLContext:
         """
         Create SSL context for HTTPS connections.
 
+        The context is shared by all clients with the same verify_ssl
+        setting and no TLSConfig, so it must not be modified.
+
         Returns:
             Configured SSL context
         """
-        context = ssl.create_default_context()
-        if not self.verify_ssl:
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-        return context
+        return _default_ssl_context(self.verify_ssl)
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """
+        Open a new connection to the server.
+
+        Returns:
+            Unconnected HTTP(S) connection; it connects on first request
+        """
+        host, port = self._host, self._port
+        if self._proxy is not None:
+            host, port, _ = self._proxy
+
+        if self._tls_sessions is not None:
+            conn: http.client.HTTPConnection = _ResumingHTTPSConnection(
+                host, port, self._tls_sessions,
+                timeout=self.timeout, context=self._ssl_context,
+            )
+        elif self._scheme == "https":
+            conn = http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self._ssl_context,
+            )
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+        if self._proxy is not None and self._scheme == "https":
+            conn.set_tunnel(self._host, self._port, headers=self._proxy[2])
+        return conn
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """
+        Perform one HTTP request over a pooled keep-alive connection.
+
+        Idle connections the server has closed are detected and replaced
+        before use. If a reused connection still turns out to be closed,
+        idempotent requests (GET) are sent once more on a new connection;
+        other requests (POST) may already have reached the server, so the
+        error is raised and left to the caller's retry policy.
+
+        Args:
+            method: HTTP method
+            path: Request path, relative to base_url
+            body: Request body bytes
+            headers: HTTP headers
+
+        Returns:
+            Tuple of (response, response_body_bytes)
+
+        Raises:
+            OSError: On connection failures and timeouts
+            http.client.HTTPException: On malformed responses
+        """
+        with self._idle_lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is not None and _connection_dropped(conn):
+            conn.close()
+            conn = None
+        reused = conn is not None
+        if conn is None:
+            conn = self._new_connection()
+
+        target = self._target_prefix + path + self._query
+        headers = headers or {}
+        if self._proxy is not None and self._scheme == "http" and self._proxy[2]:
+            headers = {**headers, **self._proxy[2]}
+        try:
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                conn = self._new_connection()
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+            payload = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self._idle_lock:
+                self._idle.append(conn)
+        return response, payload
+
+    def _ensure_background_workers(self) -> queue.Queue:
+        """
+        Start the background sender threads if not running yet.
+
+        Must be called with _bg_lock held.
+
+        Returns:
+            Queue of (path, encoded_bytes, headers) items to send
+        """
+        if self._bg_queue is None:
+            self._bg_queue = queue.Queue(maxsize=self.background_queue_size)
+            self._bg_threads = [
+                threading.Thread(
+                    target=self._background_worker,
+                    args=(self._bg_queue,),
+                    name=f"pulse-client-sender-{i}",
+                    daemon=True,
+                )
+                for i in range(max(1, self.background_workers))
+            ]
+            for thread in self._bg_threads:
+                thread.start()
+        return self._bg_queue
+
+    def _background_worker(self, work: queue.Queue) -> None:
+        """Send queued fire-and-forget messages until a None item arrives."""
+        while True:
+            item = work.get()
+            try:
+                if item is None:
+                    return
+                self._post_fire_and_forget(*item)
+            finally:
+                work.task_done()
+
+    def flush(self) -> None:
+        """
+        Wait until all queued fire-and-forget messages have been sent.
+
+        Example:
+            >>> client.send_fire_and_forget(status, wait=False)
+            >>> client.flush()
+        """
+        work = self._bg_queue
+        if work is not None:
+            work.join()
+
+    def close(self) -> None:
+        """
+        Send queued messages, stop background senders and close idle
+        keep-alive connections.
+
+        The client stays usable; later requests open new connections,
+        and later send_fire_and_forget(wait=False) calls send in the
+        calling thread instead of restarting the background senders.
+        """
+        with self._bg_lock:
+            work, threads = self._bg_queue, self._bg_threads
+            self._bg_queue, self._bg_threads = None, []
+            self._bg_closed = True
+        if work is not None:
+            for _ in threads:
+                work.put(None)
+            for thread in threads:
+                thread.join()
+
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self) -> "PulseClient":
+        """Return the client for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Flush queued messages and close connections on leaving the with block."""
+        self.close()
 
     def send(
         self,
@@ -181,6 +563,112 @@ class PulseClient:
             >>> response = client.send(message)
             >>> print(response.type)  # "RESPONSE"
         """
+        encoded_data, headers = self._prepare(message, receiver, expect_response=True)
+        response_data = self._send_with_retry(path, encoded_data, headers)
+        return self._complete(encoded_data, response_data)
+
+    def send_batch(
+        self,
+        messages: List[PulseMessage],
+        path: str = "/pulse/v1/messages",
+        receiver: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[PulseMessage]:
+        """
+        Send several PULSE messages concurrently and receive their responses.
+
+        Messages are signed and encoded up front, then sent by up to
+        max_workers threads, each over its own keep-alive connection
+        from the client's pool. http.client cannot pipeline requests on
+        one connection, so concurrency comes from parallel connections.
+        Response signatures are checked with SecurityManager.verify_batch
+        once all responses have arrived.
+
+        Args:
+            messages: PulseMessages to send
+            path: API endpoint path (default "/pulse/v1/messages")
+            receiver: Optional receiver agent ID to set in every envelope
+            max_workers: Maximum number of requests in flight (default 4)
+
+        Returns:
+            Response messages, in the same order as messages
+
+        Raises:
+            ValueError: If max_workers is less than 1
+            NetworkError: If any request fails after all retries
+            SecurityError: If a response signature verification fails
+            TimeoutError: If a request times out
+
+        Example:
+            >>> messages = [PulseMessage(action="ACT.QUERY.DATA") for _ in range(10)]
+            >>> responses = client.send_batch(messages)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        requests = [
+            self._prepare(message, receiver, expect_response=True)
+            for message in messages
+        ]
+        if len(requests) <= 1 or max_workers == 1:
+            bodies = [
+                self._send_with_retry(path, data, headers)
+                for data, headers in requests
+            ]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = min(max_workers, len(requests))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._send_with_retry, path, data, headers)
+                    for data, headers in requests
+                ]
+                bodies = [future.result() for future in futures]
+
+        responses = [self._decode_response(body) for body in bodies]
+
+        # Verify all signed responses in one pass, before counting them
+        invalid: List[int] = []
+        if self.security:
+            signed = [
+                (index, response)
+                for index, response in enumerate(responses)
+                if response.envelope.get("signature")
+            ]
+            results = self.security.verify_batch(response for _, response in signed)
+            invalid = [index for (index, _), valid in zip(signed, results) if not valid]
+
+        self._count(
+            messages_sent=len(responses) - len(invalid),
+            messages_failed=len(invalid),
+            bytes_sent=sum(len(data) for data, _ in requests),
+            bytes_received=sum(len(body) for body in bodies),
+        )
+        if invalid:
+            raise SecurityError(
+                f"Response signature verification failed (message {invalid[0]})"
+            )
+
+        return responses
+
+    def _prepare(
+        self,
+        message: PulseMessage,
+        receiver: Optional[str],
+        expect_response: bool,
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Address, sign and encode a message for sending.
+
+        Args:
+            message: PulseMessage to send
+            receiver: Optional receiver agent ID to set in envelope
+            expect_response: Whether a response message is expected
+
+        Returns:
+            Tuple of (encoded_bytes, headers)
+        """
         # Set receiver if specified
         if receiver:
             message.envelope["receiver"] = receiver
@@ -194,31 +682,37 @@ class PulseClient:
 
         # Encode message
         encoded_data, content_type = self._encode_message(message)
+        return encoded_data, self._request_headers(content_type, expect_response)
 
-        # Build request
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Content-Type": content_type,
-            "Accept": content_type,
-            "X-PULSE-Version": "1.0",
-            "X-PULSE-Sender": self.agent_id,
-            "X-PULSE-Encoding": self.encoding,
-        }
+    def _complete(self, encoded_data: bytes, response_data: bytes) -> PulseMessage:
+        """
+        Decode and verify a response, and record the exchange in stats.
+
+        Args:
+            encoded_data: Request body that was sent
+            response_data: Response body bytes
 
-        # Send with retry
-        response_data = self._send_with_retry(url, encoded_data, headers)
+        Returns:
+            PulseMessage response
 
+        Raises:
+            NetworkError: If the response cannot be decoded
+            SecurityError: If response signature verification fails
+        """
         # Decode response
         response_message = self._decode_response(response_data)
 
         # Verify response signature if security configured
         if self.security and response_message.envelope.get("signature"):
             if not self.security.verify_signature(response_message):
+                self._count(messages_failed=1)
                 raise SecurityError("Response signature verification failed")
 
-        self._stats["messages_sent"] += 1
-        self._stats["bytes_sent"] += len(encoded_data)
-        self._stats["bytes_received"] += len(response_data)
+        self._count(
+            messages_sent=1,
+            bytes_sent=len(encoded_data),
+            bytes_received=len(response_data),
+        )
 
         return response_message
 
@@ -227,6 +721,7 @@ class PulseClient:
         message: PulseMessage,
         path: str = "/pulse/v1/messages",
         receiver: Optional[str] = None,
+        wait: bool = True,
     ) -> bool:
         """
         Send a PULSE message without waiting for a structured response.
@@ -234,51 +729,75 @@ class PulseClient:
         Useful for STATUS messages, notifications, and events where
         a response is not expected.
 
+        With wait=False the message is signed and encoded immediately,
+        then queued for background sender threads and the call returns
+        without network I/O. Delivery results only show up in stats;
+        call flush() or close() to make sure queued messages are sent
+        before the process exits.
+
         Args:
             message: PulseMessage to send
             path: API endpoint path
             receiver: Optional receiver agent ID
+            wait: Send in the calling thread (default True); False queues it
 
         Returns:
-            True if message was accepted (2xx status), False otherwise
+            True if message was accepted (2xx status), False otherwise.
+            With wait=False: True if queued, False if the queue is full;
+            after close() the message is sent as with wait=True.
 
         Example:
             >>> status = PulseMessage(action="ACT.NOTIFY")
             >>> status.type = "STATUS"
             >>> success = client.send_fire_and_forget(status)
-        """
-        if receiver:
-            message.envelope["receiver"] = receiver
-
-        message.envelope["sender"] = self.agent_id
 
-        if self.security:
-            self.security.sign_message(message)
+            >>> # Return immediately, send in the background
+            >>> client.send_fire_and_forget(status, wait=False)
+        """
+        encoded_data, headers = self._prepare(message, receiver, expect_response=False)
 
-        encoded_data, content_type = self._encode_message(message)
+        if not wait:
+            # Enqueue under the lock so close() can't take the queue away
+            # between the closed check and the put.
+            with self._bg_lock:
+                if not self._bg_closed:
+                    try:
+                        self._ensure_background_workers().put_nowait(
+                            (path, encoded_data, headers)
+                        )
+                    except queue.Full:
+                        self._count(messages_failed=1)
+                        return False
+                    return True
+
+        return self._post_fire_and_forget(path, encoded_data, headers)
+
+    def _post_fire_and_forget(
+        self, path: str, encoded_data: bytes, headers: Dict[str, str]
+    ) -> bool:
+        """
+        POST an encoded message once and record the outcome in stats.
 
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Content-Type": content_type,
-            "X-PULSE-Version": "1.0",
-            "X-PULSE-Sender": self.agent_id,
-            "X-PULSE-Encoding": self.encoding,
-        }
+        Args:
+            path: API endpoint path
+            encoded_data: Encoded message bytes
+            headers: HTTP headers
 
+        Returns:
+            True if message was accepted (2xx status), False otherwise
+        """
         try:
-            request = urllib.request.Request(
-                url, data=encoded_data, headers=headers, method="POST"
-            )
-            with urllib.request.urlopen(
-                request, timeout=self.timeout, context=self._ssl_context
-            ) as response:
-                self._stats["messages_sent"] += 1
-                self._stats["bytes_sent"] += len(encoded_data)
-                return 200 <= response.status < 300
+            response, _ = self._request("POST", path, encoded_data, headers)
         except Exception:
-            self._stats["messages_failed"] += 1
+            self._count(messages_failed=1)
             return False
 
+        if 200 <= response.status < 300:
+            self._count(messages_sent=1, bytes_sent=len(encoded_data))
+            return True
+        self._count(messages_failed=1)
+        return False
+
     def ping(self, path: str = "/pulse/v1/health") -> Dict[str, Any]:
         """
         Check if the target server is reachable and healthy.
@@ -293,39 +812,25 @@ class PulseClient:
             >>> health = client.ping()
             >>> print(f"Status: {health['status']}, Latency: {health['latency_ms']}ms")
         """
-        url = f"{self.base_url}{path}"
         start_time = time.monotonic()
 
         try:
-            request = urllib.request.Request(url, method="GET")
-            request.add_header("X-PULSE-Version", "1.0")
-
-            with urllib.request.urlopen(
-                request, timeout=self.timeout, context=self._ssl_context
-            ) as response:
-                latency = (time.monotonic() - start_time) * 1000
-                body = response.read().decode("utf-8")
-
-                return {
+            response, body = self._request("GET", path, headers=_PING_HEADERS)
+            if not 200 <= response.status < 300:
+                health = {"status": "unreachable", "error": response.reason}
+            else:
+                health = {
                     "status": "healthy",
                     "status_code": response.status,
-                    "latency_ms": round(latency, 2),
-                    "body": body,
+                    "body": body.decode("utf-8"),
                 }
-        except urllib.error.URLError as e:
-            latency = (time.monotonic() - start_time) * 1000
-            return {
-                "status": "unreachable",
-                "error": str(e.reason),
-                "latency_ms": round(latency, 2),
-            }
+        except OSError as e:
+            health = {"status": "unreachable", "error": str(e)}
         except Exception as e:
-            latency = (time.monotonic() - start_time) * 1000
-            return {
-                "status": "error",
-                "error": str(e),
-                "latency_ms": round(latency, 2),
-            }
+            health = {"status": "error", "error": str(e)}
+
+        health["latency_ms"] = round((time.monotonic() - start_time) * 1000, 2)
+        return health
 
     def _encode_message(self, message: PulseMessage) -> tuple:
         """
@@ -346,43 +851,73 @@ class PulseClient:
 
         return data, content_type
 
+    def _request_headers(
+        self, content_type: str, expect_response: bool
+    ) -> Dict[str, str]:
+        """
+        Get the HTTP headers for a message request.
+
+        The dicts are cached and shared between requests; callers must
+        not modify them.
+
+        Args:
+            content_type: Content type of the encoded message
+            expect_response: Whether to include the Accept header
+
+        Returns:
+            HTTP headers dictionary
+        """
+        key = (content_type, self.agent_id, self.encoding)
+        if key != self._headers_key:
+            with_accept = {
+                "Content-Type": content_type,
+                "Accept": content_type,
+                "X-PULSE-Version": "1.0",
+                "X-PULSE-Sender": self.agent_id,
+                "X-PULSE-Encoding": self.encoding,
+            }
+            without_accept = dict(with_accept)
+            del without_accept["Accept"]
+            self._headers = (with_accept, without_accept)
+            self._headers_key = key
+        return self._headers[0] if expect_response else self._headers[1]
+
     def _decode_response(self, data: bytes) -> PulseMessage:
         """
-        Decode response based on configured format.
+        Decode response, detecting its format from the first byte.
+
+        JSON bodies start with a brace, bracket or whitespace; anything
+        else is decoded as MessagePack. Servers may answer errors in
+        JSON even to binary clients, so the configured encoding is not
+        relied on.
 
         Args:
             data: Response bytes
 
         Returns:
             PulseMessage instance
-        """
-        if self.encoding == "binary":
-            # Try binary first, fall back to JSON
-            try:
-                return BinaryEncoder.decode(data)
-            except Exception:
-                pass
-
-        # Try JSON
-        try:
-            return JSONEncoder.decode(data)
-        except Exception:
-            pass
 
-        # Try binary as last resort
+        Raises:
+            NetworkError: If the response cannot be decoded
+        """
+        decoder = JSONEncoder if data and data[0] in _JSON_FIRST_BYTES else BinaryEncoder
         try:
-            return BinaryEncoder.decode(data)
+            return decoder.decode(data)
         except Exception as e:
             raise NetworkError(f"Failed to decode response: {e}") from e
 
     def _send_with_retry(
-        self, url: str, data: bytes, headers: Dict[str, str]
+        self, path: str, data: bytes, headers: Dict[str, str]
     ) -> bytes:
         """
-        Send HTTP request with exponential backoff retry.
+        Send HTTP POST request with exponential backoff retry.
+
+        Attempt n + 1 starts no earlier than _compute_backoff(n) seconds
+        after attempt n started; time already spent in a slow failure
+        (e.g. a timeout) counts toward the wait.
 
         Args:
-            url: Request URL
+            path: Request path, relative to base_url
             data: Request body bytes
             headers: HTTP headers
 
@@ -390,72 +925,89 @@ class PulseClient:
             Response body bytes
 
         Raises:
-            NetworkError: If all retries fail
+            NetworkError: If all retries fail, or the server rejects or
+                redirects the request
             TimeoutError: If request times out
         """
         last_error = None
 
         for attempt in range(1, self.max_retries + 1):
+            started = time.monotonic()
             try:
-                request = urllib.request.Request(
-                    url, data=data, headers=headers, method="POST"
-                )
+                response, body = self._request("POST", path, data, headers)
+                status = response.status
 
-                with urllib.request.urlopen(
-                    request, timeout=self.timeout, context=self._ssl_context
-                ) as response:
-                    return response.read()
+                if 200 <= status < 300:
+                    return body
 
-            except urllib.error.HTTPError as e:
-                last_error = e
-                status = e.code
+                # Redirects are not followed: a POST can't be replayed safely
+                if status < 400:
+                    raise NetworkError(
+                        f"Server returned {status}: redirect to "
+                        f"'{response.getheader('Location', '')}' not followed"
+                    )
 
                 # Don't retry client errors (4xx) except 429 (rate limit)
-                if 400 <= status < 500 and status != 429:
-                    error_body = ""
-                    try:
-                        error_body = e.read().decode("utf-8")
-                    except Exception:
-                        pass
+                if status < 500 and status != 429:
                     raise NetworkError(
-                        f"Server returned {status}: {error_body}"
-                    ) from e
+                        f"Server returned {status}: "
+                        f"{body.decode('utf-8', errors='replace')}"
+                    )
 
                 # Retry on 5xx and 429
-                self._stats["retries_total"] += 1
-                if attempt < self.max_retries:
-                    delay = self.retry_base_delay * (2 ** (attempt - 1))
-                    time.sleep(delay)
-
-            except urllib.error.URLError as e:
-                last_error = e
-                self._stats["retries_total"] += 1
-
-                if attempt < self.max_retries:
-                    delay = self.retry_base_delay * (2 ** (attempt - 1))
-                    time.sleep(delay)
+                last_error = NetworkError(f"HTTP Error {status}: {response.reason}")
+                self._count(retries_total=1)
 
-            except TimeoutError:
+            except (NetworkError, TimeoutError):
                 raise
 
             except Exception as e:
                 last_error = e
-                self._stats["retries_total"] += 1
+                self._count(retries_total=1)
 
-                if attempt < self.max_retries:
-                    delay = self.retry_base_delay * (2 ** (attempt - 1))
-                    time.sleep(delay)
+            # Backoff (base, 2×base, 4×base, ...) is only computed once a retry follows
+            if attempt < self.max_retries:
+                remaining = started + self._compute_backoff(attempt) - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
 
-        self._stats["messages_failed"] += 1
+        self._count(messages_failed=1)
         raise NetworkError(
             f"Failed after {self.max_retries} attempts: {last_error}"
         ) from last_error
 
+    def _compute_backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff delay after a failed attempt.
+
+        The delay doubles with each attempt up to retry_max_delay and
+        is then spread randomly by ±retry_jitter, so clients that failed
+        together do not retry in lockstep.
+
+        Args:
+            attempt: Number of the failed attempt (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.retry_max_delay, self.retry_base_delay * (1 << (attempt - 1)))
+        if self.retry_jitter:
+            delay *= 1 + random.uniform(-self.retry_jitter, self.retry_jitter)
+        return delay
+
+    def _count(self, **increments: int) -> None:
+        """Add to statistics counters; safe to call from worker threads."""
+        with self._stats_lock:
+            for key, amount in increments.items():
+                self._stats[key] += amount
+
     @property
     def stats(self) -> Dict[str, Any]:
         """
         Get client statistics.
 
+        Returns a snapshot copy; see stats_view for polling without copies.
+
         Returns:
             Dictionary with message counts, bytes transferred, retry info
 
@@ -463,12 +1015,33 @@ class PulseClient:
             >>> print(client.stats)
             {'messages_sent': 5, 'messages_failed': 0, ...}
         """
-        return dict(self._stats)
+        with self._stats_lock:
+            return dict(self._stats)
+
+    @property
+    def stats_view(self) -> Mapping[str, int]:
+        """
+        Get a live, read-only view of client statistics.
+
+        The same mapping is returned on every access and reflects later
+        updates, so frequent polling allocates nothing. Use stats for a
+        consistent snapshot or a plain dict (e.g. to serialize).
+
+        Returns:
+            Read-only mapping with message counts, bytes transferred, retry info
+
+        Example:
+            >>> view = client.stats_view
+            >>> client.send(message)
+            >>> print(view['messages_sent'])
+        """
+        return self._stats_view
 
     def reset_stats(self) -> None:
         """Reset all statistics to zero."""
-        for key in self._stats:
-            self._stats[key] = 0
+        with self._stats_lock:
+            for key in self._stats:
+                self._stats[key] = 0
 
     def __repr__(self) -> str:
         """Return string representation of client."""
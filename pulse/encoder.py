@@ -5,10 +5,200 @@ This module provides encoding and decoding functionality for PULSE messages:
 - Binary: Efficient MessagePack encoding (~10× smaller)
 - Compact: Ultra-efficient custom format (~13× smaller) - Coming soon
 """
-from typing import Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+import hashlib
 import json
-import msgpack
+import os
+import struct
+import threading
+import time
 from pulse.exceptions import EncodingError, DecodingError
+from pulse.message import PulseMessage
+
+# Inputs accepted by the decoders; buffers are read in place, not copied
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# PULSE_PURE_PYTHON=1 restricts encoding to pure-Python code: the optional
+# native backends are skipped and msgpack uses its pure-Python implementation.
+# Useful on PyPy, where the JIT speeds up these paths without compiled code.
+PURE_PYTHON = os.environ.get("PULSE_PURE_PYTHON", "").lower() in ("1", "true", "yes")
+
+# Optional native backends (pip install pulse-protocol[fast]).
+# They produce the same wire formats as msgpack/json, which remain the fallback.
+# The MessagePack backend is imported on first binary/compact use, so
+# JSON-only callers never load it.
+ormsgpack = None
+orjson = None
+_MSGPACK_BACKEND: Optional[str] = None
+
+if not PURE_PYTHON:
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on installed extras
+        pass
+
+
+def _load_msgpack() -> str:
+    """
+    Import the MessagePack backend and bind the pack/unpack helpers.
+
+    Replaces the module-level _packb, _unpackb and _reusable_packb
+    stubs with the backend implementations; safe to call repeatedly.
+
+    Returns:
+        Name of the active backend
+    """
+    global ormsgpack, _MSGPACK_BACKEND, _packb, _unpackb, _reusable_packb
+
+    if _MSGPACK_BACKEND is not None:
+        return _MSGPACK_BACKEND
+
+    if not PURE_PYTHON:
+        try:
+            import ormsgpack as _ormsgpack
+        except ImportError:  # pragma: no cover - depends on installed extras
+            _ormsgpack = None
+    else:
+        _ormsgpack = None
+
+    if _ormsgpack is not None:
+        backend = "ormsgpack"
+
+        def packb(obj: Any) -> bytes:
+            return _ormsgpack.packb(obj, option=_ormsgpack.OPT_NON_STR_KEYS)
+
+        def unpackb(data: bytes) -> Any:
+            return _ormsgpack.unpackb(data, option=_ormsgpack.OPT_NON_STR_KEYS)
+
+        def reusable_packb() -> Callable[[Any], bytes]:
+            return packb  # ormsgpack keeps no per-call packer state
+
+    else:
+        import msgpack
+        import msgpack.fallback
+
+        # msgpack itself falls back to pure Python where its C extension is
+        # unavailable (e.g. PyPy); PURE_PYTHON forces that implementation
+        impl = msgpack.fallback if PURE_PYTHON else msgpack
+        if impl.Packer is msgpack.fallback.Packer:
+            backend = "msgpack-fallback"
+        else:
+            backend = "msgpack"
+
+        # One Packer per thread: Packer keeps an internal buffer, so it
+        # can't be shared between threads, but reusing it skips its setup
+        packers = threading.local()
+
+        def packb(obj: Any) -> bytes:
+            try:
+                pack = packers.pack
+            except AttributeError:
+                pack = packers.pack = impl.Packer(use_bin_type=True).pack
+            return pack(obj)
+
+        def unpackb(data: bytes) -> Any:
+            return impl.unpackb(data, raw=False, strict_map_key=False)
+
+        def reusable_packb() -> Callable[[Any], bytes]:
+            # One Packer for many objects skips the per-call setup of packb
+            return impl.Packer(use_bin_type=True).pack
+
+    ormsgpack = _ormsgpack
+    _packb, _unpackb, _reusable_packb = packb, unpackb, reusable_packb
+    _MSGPACK_BACKEND = backend
+    return backend
+
+
+# Stubs that load the backend on first call; _load_msgpack rebinds them
+def _packb(obj: Any) -> bytes:
+    _load_msgpack()
+    return _packb(obj)
+
+
+def _unpackb(data: bytes) -> Any:
+    _load_msgpack()
+    return _unpackb(data)
+
+
+def _reusable_packb() -> Callable[[Any], bytes]:
+    _load_msgpack()
+    return _reusable_packb()
+
+
+class _BackendName:
+    """Class attribute that reports the MessagePack backend, loading it on access."""
+
+    def __get__(self, instance: Any, owner: type) -> str:
+        return _load_msgpack()
+
+
+def _json_dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Uses orjson for compact and 2-space output when available. Other
+    indents, and values orjson rejects (e.g. integers beyond 64 bits),
+    go through the stdlib encoder. Compact output has no whitespace.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indentation (None for compact)
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, indent=indent, ensure_ascii=False, separators=separators).encode(
+        "utf-8"
+    )
+
+
+def _json_loads(data: Any) -> Any:
+    """
+    Parse JSON from a bytes-like object or str.
+
+    Args:
+        data: JSON document as bytes, bytearray, memoryview or str
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # Retry with stdlib (e.g. integers beyond 64 bits)
+    if isinstance(data, memoryview):
+        data = data.tobytes()  # stdlib json does not take memoryview
+    return json.loads(data)
+
+
+def _message_from_dict(data: dict) -> PulseMessage:
+    """
+    Rebuild a PulseMessage from its dict form without validation.
+
+    Args:
+        data: Dictionary with envelope, type and content
+
+    Returns:
+        PulseMessage instance preserving the exact decoded data
+    """
+    message = PulseMessage.__new__(PulseMessage)
+    message.envelope = data["envelope"]
+    message.type = data["type"]
+    message.content = data["content"]
+    return message
 
 
 class JSONEncoder:
@@ -21,6 +211,10 @@ class JSONEncoder:
     - Human-readable APIs
     - Documentation and examples
 
+    Uses orjson when installed and the stdlib json module otherwise.
+    Passing ``indent=None`` produces compact output and skips
+    pretty-printing entirely.
+
     Example:
         >>> encoder = JSONEncoder()
         >>> json_bytes = encoder.encode(message)
@@ -47,19 +241,17 @@ class JSONEncoder:
             >>> print(len(json_bytes))  # ~800 bytes typical
         """
         try:
-            data = message.to_dict()
-            json_str = json.dumps(data, indent=indent, ensure_ascii=False)
-            return json_str.encode("utf-8")
+            return _json_dumps(message.to_dict(), indent=indent)
         except Exception as e:
             raise EncodingError(f"JSON encoding failed: {str(e)}") from e
 
     @staticmethod
-    def decode(data: bytes):
+    def decode(data: BytesLike):
         """
         Decode JSON bytes to PULSE message.
 
         Args:
-            data: UTF-8 encoded JSON bytes
+            data: UTF-8 encoded JSON (bytes, bytearray or memoryview)
 
         Returns:
             PulseMessage instance
@@ -71,11 +263,7 @@ class JSONEncoder:
             >>> message = JSONEncoder.decode(json_bytes)
         """
         try:
-            # Import here to avoid circular dependency
-            from pulse.message import PulseMessage
-
-            json_str = data.decode("utf-8")
-            return PulseMessage.from_json(json_str)
+            return _message_from_dict(_json_loads(data))
         except Exception as e:
             raise DecodingError(f"JSON decoding failed: {str(e)}") from e
 
@@ -93,6 +281,12 @@ class BinaryEncoder:
     MessagePack is a binary format similar to JSON but much more compact.
     It's widely supported across programming languages.
 
+    Uses the native ``ormsgpack`` backend when installed and falls back
+    to ``msgpack`` otherwise; both produce the same wire format.
+
+    Attributes:
+        BACKEND: Name of the active MessagePack backend
+
     Example:
         >>> encoder = BinaryEncoder()
         >>> binary = encoder.encode(message)
@@ -100,6 +294,8 @@ class BinaryEncoder:
         >>> decoded = encoder.decode(binary)
     """
 
+    BACKEND = _BackendName()
+
     @staticmethod
     def encode(message) -> bytes:
         """
@@ -120,17 +316,20 @@ class BinaryEncoder:
         """
         try:
             data = message.to_dict()
-            return msgpack.packb(data, use_bin_type=True)
+            return _packb(data)
         except Exception as e:
             raise EncodingError(f"Binary encoding failed: {str(e)}") from e
 
     @staticmethod
-    def decode(data: bytes):
+    def decode(data: BytesLike):
         """
         Decode binary MessagePack to PULSE message.
 
+        The input buffer is unpacked in place, so a memoryview over a
+        larger receive buffer can be passed without slicing out a copy.
+
         Args:
-            data: MessagePack encoded bytes
+            data: MessagePack encoded bytes, bytearray or memoryview
 
         Returns:
             PulseMessage instance
@@ -142,20 +341,57 @@ class BinaryEncoder:
             >>> message = BinaryEncoder.decode(binary_data)
         """
         try:
-            # Import here to avoid circular dependency
-            from pulse.message import PulseMessage
+            # Reconstruct message without validation to preserve exact data
+            return _message_from_dict(_unpackb(data))
+        except Exception as e:
+            raise DecodingError(f"Binary decoding failed: {str(e)}") from e
 
-            decoded = msgpack.unpackb(data, raw=False, strict_map_key=False)
+    @staticmethod
+    def encode_batch(messages: Iterable) -> List[bytes]:
+        """
+        Encode many PULSE messages, reusing one packer.
 
-            # Reconstruct message without validation to preserve exact data
-            message = PulseMessage.__new__(PulseMessage)
-            message.envelope = decoded["envelope"]
-            message.type = decoded["type"]
-            message.content = decoded["content"]
+        Args:
+            messages: Iterable of PulseMessage instances
 
-            return message
+        Returns:
+            List of MessagePack encoded bytes, one per message
+
+        Raises:
+            EncodingError: If any message fails to encode
+
+        Example:
+            >>> payloads = BinaryEncoder.encode_batch([msg1, msg2, msg3])
+            >>> len(payloads)
+            3
+        """
+        try:
+            packb = _reusable_packb()
+            return [packb(message.to_dict()) for message in messages]
         except Exception as e:
-            raise DecodingError(f"Binary decoding failed: {str(e)}") from e
+            raise EncodingError(f"Binary batch encoding failed: {str(e)}") from e
+
+    @staticmethod
+    def decode_batch(payloads: Iterable[BytesLike]) -> List:
+        """
+        Decode many binary MessagePack payloads.
+
+        Args:
+            payloads: Iterable of MessagePack encoded bytes
+
+        Returns:
+            List of PulseMessage instances, in input order
+
+        Raises:
+            DecodingError: If any payload fails to decode
+
+        Example:
+            >>> messages = BinaryEncoder.decode_batch(payloads)
+        """
+        try:
+            return [_message_from_dict(_unpackb(data)) for data in payloads]
+        except Exception as e:
+            raise DecodingError(f"Binary batch decoding failed: {str(e)}") from e
 
 
 class CompactEncoder:
@@ -196,6 +432,9 @@ class CompactEncoder:
     TYPE_MAP = {"REQUEST": 0, "RESPONSE": 1, "ERROR": 2, "STATUS": 3}
     TYPE_REVERSE = {v: k for k, v in TYPE_MAP.items()}
 
+    # Fixed 30-byte header layout (see format specification above)
+    _HEADER = struct.Struct(">BBQQIHHI")
+
     # Build vocabulary index on first use
     _vocab_index = None
     _vocab_reverse = None
@@ -208,12 +447,10 @@ class CompactEncoder:
 
         from pulse.vocabulary import Vocabulary
 
-        cls._vocab_index = {}
-        cls._vocab_reverse = {}
-
-        for i, concept in enumerate(sorted(Vocabulary.CONCEPTS.keys())):
-            cls._vocab_index[concept] = i
-            cls._vocab_reverse[i] = concept
+        # Share the vocabulary's sorted-order integer indexes
+        Vocabulary._build_indexes()
+        cls._vocab_reverse = dict(enumerate(Vocabulary._concepts_by_index))
+        cls._vocab_index = Vocabulary._concept_index
 
     @staticmethod
     def _fnv1a_32(data: str) -> int:
@@ -228,10 +465,26 @@ class CompactEncoder:
         """
         h = 0x811C9DC5  # FNV offset basis
         for byte in data.encode("utf-8"):
-            h ^= byte
-            h = (h * 0x01000193) & 0xFFFFFFFF  # FNV prime, mask to 32 bits
+            h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF  # FNV prime, mask to 32 bits
         return h
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sender_hash(sender: str) -> int:
+        """
+        FNV-1a 32-bit hash of a sender ID, memoized.
+
+        Senders repeat across messages, unlike nonces, so their hashes
+        are worth caching.
+
+        Args:
+            sender: Agent ID of the sender
+
+        Returns:
+            32-bit hash value
+        """
+        return CompactEncoder._fnv1a_32(sender)
+
     @staticmethod
     def _hash_uuid(uuid_str: str) -> int:
         """
@@ -243,8 +496,6 @@ class CompactEncoder:
         Returns:
             64-bit hash value
         """
-        import hashlib
-
         digest = hashlib.md5(uuid_str.encode("utf-8")).digest()
         return int.from_bytes(digest[:8], "big")
 
@@ -259,8 +510,6 @@ class CompactEncoder:
         Returns:
             Microseconds since Unix epoch
         """
-        from datetime import datetime, timezone
-
         if timestamp_str.endswith("Z"):
             timestamp_str = timestamp_str[:-1] + "+00:00"
         dt = datetime.fromisoformat(timestamp_str)
@@ -275,12 +524,11 @@ class CompactEncoder:
             micros: Microseconds since Unix epoch
 
         Returns:
-            ISO 8601 timestamp string with Z suffix
+            ISO 8601 timestamp string with Z suffix and microseconds
         """
-        from datetime import datetime, timezone
-
-        dt = datetime.fromtimestamp(micros / 1_000_000, tz=timezone.utc)
-        return dt.isoformat().replace("+00:00", "Z")
+        seconds, micros = divmod(micros, 1_000_000)
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        return f"{prefix}.{micros:06d}Z"
 
     @classmethod
     def encode(cls, message) -> bytes:
@@ -300,8 +548,6 @@ class CompactEncoder:
             >>> compact = CompactEncoder.encode(message)
             >>> print(f"Size: {len(compact)} bytes")
         """
-        import struct
-
         cls._build_vocab_index()
 
         try:
@@ -327,7 +573,7 @@ class CompactEncoder:
             )
 
             # Bytes 18-21: Sender hash (32-bit)
-            sender_hash = cls._fnv1a_32(envelope.get("sender", ""))
+            sender_hash = cls._sender_hash(envelope.get("sender", ""))
 
             # Bytes 22-23: Action index (16-bit)
             action = content.get("action", "")
@@ -344,8 +590,7 @@ class CompactEncoder:
 
             # Pack fixed header (30 bytes)
             msg_id_hash = msg_id_hash & 0xFFFFFFFFFFFFFFFF
-            header = struct.pack(
-                ">BBQQIHHI",
+            header = cls._HEADER.pack(
                 magic,           # B: 1 byte magic
                 version_type,    # B: 1 byte version+type
                 timestamp_micros,  # Q: 8 bytes timestamp
@@ -359,7 +604,7 @@ class CompactEncoder:
             # Parameters: MessagePack (only if non-empty)
             params = content.get("parameters", {})
             if params:
-                params_data = msgpack.packb(params, use_bin_type=True)
+                params_data = _packb(params)
                 return header + params_data
             else:
                 return header
@@ -368,12 +613,12 @@ class CompactEncoder:
             raise EncodingError(f"Compact encoding failed: {e}") from e
 
     @classmethod
-    def decode(cls, data: bytes):
+    def decode(cls, data: BytesLike):
         """
         Decode compact binary to PULSE message.
 
         Args:
-            data: Compact binary encoded bytes
+            data: Compact binary encoded bytes, bytearray or memoryview
 
         Returns:
             PulseMessage instance
@@ -384,14 +629,9 @@ class CompactEncoder:
         Example:
             >>> message = CompactEncoder.decode(compact_data)
         """
-        import struct
-        import uuid
-
         cls._build_vocab_index()
 
         try:
-            from pulse.message import PulseMessage
-
             if len(data) < 30:
                 raise DecodingError(
                     f"Compact data too short: {len(data)} bytes (minimum 30)"
@@ -413,7 +653,7 @@ class CompactEncoder:
                 action_idx,
                 target_idx,
                 nonce_hash,
-            ) = struct.unpack(">BBQQIHHI", data[:30])
+            ) = cls._HEADER.unpack_from(data)
 
             # Decode version and type
             version = (version_type >> 4) & 0x0F
@@ -435,9 +675,7 @@ class CompactEncoder:
             # Decode parameters
             params = {}
             if len(data) > 30:
-                params = msgpack.unpackb(
-                    data[30:], raw=False, strict_map_key=False
-                )
+                params = _unpackb(memoryview(data)[30:])
 
             # Reconstruct message
             message = PulseMessage.__new__(PulseMessage)
@@ -465,6 +703,33 @@ class CompactEncoder:
             raise DecodingError(f"Compact decoding failed: {e}") from e
 
 
+@lru_cache(maxsize=256)
+def _json_and_compact_sizes(binary_data: bytes) -> Tuple[int, int]:
+    """
+    Measure compact JSON and Compact sizes for a binary-encoded message.
+
+    Keyed on the MessagePack bytes, which are immutable and fully determine
+    the message content, so repeated comparisons of the same message are free.
+
+    Args:
+        binary_data: MessagePack encoded message
+
+    Returns:
+        Tuple of (json_size, compact_size)
+    """
+    message = BinaryEncoder.decode(binary_data)
+    json_size = len(JSONEncoder.encode(message, indent=None))
+    compact_size = len(CompactEncoder.encode(message))
+    return json_size, compact_size
+
+
+# First bytes used by Encoder.decode to detect the format: JSON text
+# starts with a brace, bracket or whitespace; a MessagePack message is
+# always a map (fixmap 0x80-0x8f, map16 0xde, map32 0xdf).
+_JSON_FIRST_BYTES = frozenset(b"{[ \t\n\r")
+_MSGPACK_MAP_FIRST_BYTES = frozenset(range(0x80, 0x90)) | {0xDE, 0xDF}
+
+
 class Encoder:
     """
     Unified encoder supporting multiple formats.
@@ -493,6 +758,18 @@ class Encoder:
         self.binary_encoder = BinaryEncoder()
         self.compact_encoder = CompactEncoder()
 
+        # Format name -> handler, looked up once per call
+        self._encoders = {
+            "json": self.json_encoder.encode,
+            "binary": self.binary_encoder.encode,
+            "compact": self.compact_encoder.encode,
+        }
+        self._decoders = {
+            "json": self.json_encoder.decode,
+            "binary": self.binary_encoder.decode,
+            "compact": self.compact_encoder.decode,
+        }
+
     def encode(self, message, format: str = "json") -> bytes:
         """
         Encode message in specified format.
@@ -512,26 +789,53 @@ class Encoder:
             >>> json_data = encoder.encode(message, format="json")
             >>> binary_data = encoder.encode(message, format="binary")
         """
+        encode = self._encoders.get(format) or self._encoders.get(format.lower())
+        if encode is None:
+            raise EncodingError(
+                f"Unknown format: '{format}'. "
+                f"Supported formats: json, binary, compact"
+            )
+        return encode(message)
+
+    def encode_batch(self, messages: Iterable, format: str = "json") -> List[bytes]:
+        """
+        Encode many messages in the specified format.
+
+        Binary batches go through BinaryEncoder.encode_batch(), which reuses
+        one packer for all messages.
+
+        Args:
+            messages: Iterable of PulseMessage instances
+            format: Format name ("json", "binary", "compact")
+
+        Returns:
+            List of encoded bytes, one per message
+
+        Raises:
+            EncodingError: If format invalid or any message fails to encode
+
+        Example:
+            >>> encoder = Encoder()
+            >>> payloads = encoder.encode_batch([msg1, msg2], format="binary")
+        """
         format_lower = format.lower()
 
-        if format_lower == "json":
-            return self.json_encoder.encode(message)
-        elif format_lower == "binary":
-            return self.binary_encoder.encode(message)
-        elif format_lower == "compact":
-            return self.compact_encoder.encode(message)
-        else:
+        if format_lower == "binary":
+            return self.binary_encoder.encode_batch(messages)
+        encode = self._encoders.get(format_lower)
+        if encode is None:
             raise EncodingError(
                 f"Unknown format: '{format}'. "
                 f"Supported formats: json, binary, compact"
             )
+        return [encode(message) for message in messages]
 
-    def decode(self, data: bytes, format: Optional[str] = None):
+    def decode(self, data: BytesLike, format: Optional[str] = None):
         """
         Decode message, auto-detecting format if not specified.
 
         Args:
-            data: Encoded bytes
+            data: Encoded bytes, bytearray or memoryview
             format: Format name (optional, will auto-detect if None)
 
         Returns:
@@ -547,30 +851,28 @@ class Encoder:
         """
         # If format specified, use it directly
         if format:
-            format_lower = format.lower()
-            if format_lower == "json":
-                return self.json_encoder.decode(data)
-            elif format_lower == "binary":
-                return self.binary_encoder.decode(data)
-            elif format_lower == "compact":
-                return self.compact_encoder.decode(data)
-            else:
+            decode = self._decoders.get(format) or self._decoders.get(format.lower())
+            if decode is None:
                 raise DecodingError(f"Unknown format: '{format}'")
+            return decode(data)
+
+        # Auto-detect format from the first byte
+        if not data:
+            raise DecodingError("Failed to decode data: empty input")
+        first = data[0]
+        if first in _JSON_FIRST_BYTES:
+            decode = self.json_encoder.decode
+        elif first in _MSGPACK_MAP_FIRST_BYTES:
+            decode = self.binary_encoder.decode
+        elif first == CompactEncoder.MAGIC:
+            decode = self.compact_encoder.decode
+        else:
+            raise DecodingError(
+                f"Failed to decode data: unrecognized format (first byte 0x{first:02x})"
+            )
 
-        # Auto-detect format
         try:
-            # Try JSON first (starts with { or [)
-            if data[0:1] in (b"{", b"["):
-                return self.json_encoder.decode(data)
-
-            # Try Compact format (starts with magic byte 0xAE)
-            if data[0:1] == bytes([CompactEncoder.MAGIC]):
-                return self.compact_encoder.decode(data)
-
-            # Try MessagePack binary
-            # MessagePack starts with specific byte patterns
-            return self.binary_encoder.decode(data)
-
+            return decode(data)
         except Exception as e:
             raise DecodingError(f"Failed to decode data: {str(e)}") from e
 
@@ -578,6 +880,8 @@ class Encoder:
         """
         Compare sizes across all formats.
 
+        Results are memoized per distinct message content.
+
         Args:
             message: PulseMessage to analyze
 
@@ -590,13 +894,9 @@ class Encoder:
             >>> print(f"JSON: {sizes['json']} bytes")
             >>> print(f"Binary: {sizes['binary']} bytes ({sizes['binary_reduction']}× smaller)")
         """
-        json_data = self.json_encoder.encode(message, indent=None)
         binary_data = self.binary_encoder.encode(message)
-        compact_data = self.compact_encoder.encode(message)
-
-        json_size = len(json_data)
+        json_size, compact_size = _json_and_compact_sizes(binary_data)
         binary_size = len(binary_data)
-        compact_size = len(compact_data)
 
         return {
             "json": json_size,
@@ -1,12 +1,66 @@
 """PULSE Protocol core message implementation."""
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
-import uuid
-import json
+from typing import IO, Optional, Dict, Any, Tuple, Union
+import os
+import sys
+import time
 from pulse.validator import MessageValidator
 from pulse.exceptions import ValidationError
 
 
+# Envelope fields in wire order; per-message values are filled in on copy
+_ENVELOPE_TEMPLATE: Dict[str, Any] = {
+    "version": "1.0",
+    "timestamp": None,
+    "sender": None,
+    "receiver": None,
+    "message_id": None,
+    "nonce": None,
+    "signature": None,
+}
+
+
+def _message_id_and_nonce() -> Tuple[str, str]:
+    """
+    Generate a message ID and nonce from a single os.urandom call.
+
+    The message ID has the same format as ``str(uuid.uuid4())``, without
+    building a UUID object. The nonce is 128 random bits as 32 lowercase
+    hex characters (the ``uuid4().hex`` shape, with no fixed version bits).
+
+    Returns:
+        Tuple of (canonical 36-character UUID string, 32-character hex nonce)
+    """
+    raw = bytearray(os.urandom(32))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # Version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}", h[32:]
+
+
+# (second, "YYYY-MM-DDTHH:MM:SS.") for the most recently formatted second.
+# Stored as one tuple so concurrent readers never see a mismatched pair.
+_LAST_SECOND: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string.
+
+    The date/time prefix is formatted once per second and reused, so
+    back-to-back calls only format the microsecond part.
+
+    Returns:
+        Timestamp with "Z" suffix (e.g., "2026-01-01T00:00:00.123456Z")
+    """
+    global _LAST_SECOND
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _LAST_SECOND
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(second))
+        _LAST_SECOND = (second, prefix)
+    return f"{prefix}{nanos // 1000:06d}Z"
+
+
 class PulseMessage:
     """
     Core PULSE Protocol message.
@@ -27,6 +81,8 @@ class PulseMessage:
         >>> json_str = message.to_json()
     """
 
+    __slots__ = ("envelope", "type", "content")
+
     def __init__(
         self,
         action: str,
@@ -55,6 +111,12 @@ class PulseMessage:
             ...     parameters={"query": "test"}
             ... )
         """
+        # Share the vocabulary's interned concept strings
+        if isinstance(action, str):
+            action = sys.intern(action)
+        if isinstance(target, str):
+            target = sys.intern(target)
+
         self.envelope = self._create_envelope(sender)
         self.type = "REQUEST"
         self.content = {
@@ -63,9 +125,14 @@ class PulseMessage:
             "parameters": parameters or {},
         }
 
-        # Validate message if requested
+        # Validate message if requested. The envelope's version, timestamp,
+        # message_id and nonce were generated above and are valid by
+        # construction, so only the caller-supplied sender and content are
+        # checked (same checks and error order as validate())
         if validate:
-            self.validate()
+            if not sender or len(sender.strip()) == 0:
+                raise ValidationError("Sender ID cannot be empty")
+            MessageValidator.validate_content(self.content)
 
     def _create_envelope(self, sender: str) -> Dict[str, Any]:
         """
@@ -77,15 +144,13 @@ class PulseMessage:
         Returns:
             Dictionary containing envelope fields
         """
-        return {
-            "version": "1.0",
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "sender": sender,
-            "receiver": None,
-            "message_id": str(uuid.uuid4()),
-            "nonce": str(uuid.uuid4()),
-            "signature": None,
-        }
+        # Copying a prebuilt dict and filling the per-message fields is
+        # cheaper than building the literal from scratch
+        envelope = _ENVELOPE_TEMPLATE.copy()
+        envelope["timestamp"] = _utc_timestamp()
+        envelope["sender"] = sender
+        envelope["message_id"], envelope["nonce"] = _message_id_and_nonce()
+        return envelope
 
     def to_json(self, indent: Optional[int] = 2) -> str:
         """
@@ -95,7 +160,8 @@ class PulseMessage:
         that can be transmitted over the network or saved to disk.
 
         Args:
-            indent: Number of spaces for indentation (None for compact)
+            indent: Number of spaces for indentation (None for compact).
+                Compact output has no whitespace.
 
         Returns:
             JSON string representation of the message
@@ -110,9 +176,12 @@ class PulseMessage:
               "content": {...}
             }
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        from pulse.encoder import _json_dumps
+
+        # orjson when installed, stdlib json otherwise
+        return _json_dumps(self.to_dict(), indent=indent).decode("utf-8")
 
-    def to_binary(self) -> bytes:
+    def to_binary(self, validate: bool = False) -> bytes:
         """
         Serialize message to binary MessagePack format.
 
@@ -123,10 +192,16 @@ class PulseMessage:
         - Storage optimization
         - Performance-critical applications
 
+        Args:
+            validate: Validate the message before encoding (default False).
+                Lets producers build messages with ``validate=False`` and
+                validate once, at serialization time.
+
         Returns:
             MessagePack encoded bytes
 
         Raises:
+            ValidationError: If validate is True and the message is invalid
             EncodingError: If encoding fails
 
         Example:
@@ -136,6 +211,8 @@ class PulseMessage:
         """
         from pulse.encoder import BinaryEncoder
 
+        if validate:
+            self.validate()
         return BinaryEncoder.encode(self)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -148,14 +225,17 @@ class PulseMessage:
         return {"envelope": self.envelope, "type": self.type, "content": self.content}
 
     @classmethod
-    def from_json(cls, json_str: str) -> "PulseMessage":
+    def from_json(
+        cls, json_str: Union[str, bytes, bytearray, memoryview]
+    ) -> "PulseMessage":
         """
         Deserialize message from JSON string.
 
-        Creates a PulseMessage instance from a JSON string.
+        Creates a PulseMessage instance from a JSON string. UTF-8 encoded
+        bytes are parsed directly, without decoding to str first.
 
         Args:
-            json_str: JSON string representation of a message
+            json_str: JSON string, or UTF-8 JSON bytes, bytearray or memoryview
 
         Returns:
             PulseMessage instance
@@ -167,7 +247,9 @@ class PulseMessage:
             >>> json_str = '{"envelope": {...}, "type": "REQUEST", "content": {...}}'
             >>> message = PulseMessage.from_json(json_str)
         """
-        data = json.loads(json_str)
+        from pulse.encoder import _json_loads
+
+        data = _json_loads(json_str)
         message = cls.__new__(cls)
         message.envelope = data["envelope"]
         message.type = data["type"]
@@ -175,14 +257,37 @@ class PulseMessage:
         return message
 
     @classmethod
-    def from_binary(cls, binary_data: bytes) -> "PulseMessage":
+    def from_json_stream(cls, reader: IO[bytes]) -> "PulseMessage":
+        """
+        Deserialize message from a binary stream of UTF-8 JSON.
+
+        Reads the stream to its end and parses the bytes as they are,
+        skipping the intermediate str a text read would build.
+
+        Args:
+            reader: Binary file-like object (file, socket file, HTTP response)
+
+        Returns:
+            PulseMessage instance
+
+        Raises:
+            json.JSONDecodeError: If JSON is invalid
+
+        Example:
+            >>> with open("message.json", "rb") as f:
+            ...     message = PulseMessage.from_json_stream(f)
+        """
+        return cls.from_json(reader.read())
+
+    @classmethod
+    def from_binary(cls, binary_data: Union[bytes, bytearray, memoryview]) -> "PulseMessage":
         """
         Deserialize message from binary MessagePack format.
 
         Creates a PulseMessage instance from MessagePack encoded bytes.
 
         Args:
-            binary_data: MessagePack encoded bytes
+            binary_data: MessagePack encoded bytes, bytearray or memoryview
 
         Returns:
             PulseMessage instance
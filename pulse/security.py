@@ -4,7 +4,7 @@ This module provides:
 - HMAC-SHA256 message signing for integrity verification
 - Signature verification
 - Key management utilities
-- Replay protection (timestamp-based)
+- Replay protection (timestamp-based, with a bounded nonce store)
 
 Security Features:
 - HMAC-SHA256 for message authentication
@@ -12,11 +12,26 @@ Security Features:
 - No encryption (protocol is not end-to-end encrypted by default)
 - Compatible with TLS for transport security
 """
-from typing import Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Union
 import hmac
+import json
 import hashlib
+import re
 import secrets
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+
+# Compact JSON with sorted keys for deterministic canonical strings.
+# A shared encoder avoids json.dumps building a new one for every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+# HMAC (RFC 2104) pad translation tables for SHA-256's 64-byte block
+_SHA256_BLOCK_SIZE = 64
+_TRANS_IPAD = bytes(x ^ 0x36 for x in range(256))
+_TRANS_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+# Signatures are hexdigest() output: exactly 64 lowercase hex characters
+_SIGNATURE_PATTERN = re.compile(r"[0-9a-f]{64}")
 
 
 class SecurityManager:
@@ -54,6 +69,43 @@ class SecurityManager:
         else:
             self.secret_key = secret_key
 
+    @property
+    def secret_key(self) -> str:
+        """Secret key used for HMAC signing."""
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, value: str) -> None:
+        self._secret_key = value
+
+        # Absorb the padded key into the inner and outer SHA-256 states
+        # once; each signature then starts from copies of these states
+        key = value.encode('utf-8')
+        if len(key) > _SHA256_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_SHA256_BLOCK_SIZE, b'\0')
+        self._inner = hashlib.sha256(key.translate(_TRANS_IPAD))
+        self._outer = hashlib.sha256(key.translate(_TRANS_OPAD))
+
+    def _mac(self, canonical: str) -> bytes:
+        """
+        Compute the HMAC-SHA256 of a canonical string.
+
+        The keyed inner/outer states are only ever copied, never updated,
+        so one SecurityManager can sign and verify from several threads.
+
+        Args:
+            canonical: Canonical string representation of a message
+
+        Returns:
+            Raw 32-byte HMAC-SHA256 digest
+        """
+        inner = self._inner.copy()
+        inner.update(canonical.encode('utf-8'))
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
     @staticmethod
     def generate_key() -> str:
         """
@@ -95,17 +147,32 @@ class SecurityManager:
         canonical = self._create_canonical_string(message)
 
         # Sign with HMAC-SHA256
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            canonical.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        signature = self._mac(canonical).hex()
 
         # Store signature in envelope
         message.envelope['signature'] = signature
 
         return signature
 
+    def sign_batch(self, messages: Iterable) -> List[str]:
+        """
+        Sign many PULSE messages with HMAC-SHA256.
+
+        Equivalent to calling sign_message on each message; each
+        signature is also stored in its message's envelope.
+
+        Args:
+            messages: Iterable of PulseMessage instances to sign
+
+        Returns:
+            List of hex-encoded signatures, one per message
+
+        Example:
+            >>> signatures = security.sign_batch([msg1, msg2, msg3])
+            >>> assert msg1.envelope['signature'] == signatures[0]
+        """
+        return [self.sign_message(message) for message in messages]
+
     def verify_signature(self, message, expected_signature: Optional[str] = None) -> bool:
         """
         Verify PULSE message signature.
@@ -136,24 +203,42 @@ class SecurityManager:
         if not expected_signature:
             return False
 
-        # Temporarily remove signature to compute canonical string
-        stored_signature = message.envelope.get('signature')
-        message.envelope['signature'] = None
+        # Compare raw digests. Only the exact form sign_message produces
+        # is accepted: fromhex() alone would also take uppercase and
+        # whitespace-separated variants of a valid signature.
+        if not isinstance(expected_signature, str):
+            return False
+        if not _SIGNATURE_PATTERN.fullmatch(expected_signature):
+            return False
+        expected_digest = bytes.fromhex(expected_signature)
 
-        try:
-            # Recompute signature
-            canonical = self._create_canonical_string(message)
-            computed_signature = hmac.new(
-                self.secret_key.encode('utf-8'),
-                canonical.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-
-            # Constant-time comparison to prevent timing attacks
-            return hmac.compare_digest(computed_signature, expected_signature)
-        finally:
-            # Restore original signature
-            message.envelope['signature'] = stored_signature
+        # Recompute signature (the canonical string never includes it)
+        canonical = self._create_canonical_string(message)
+        computed_digest = self._mac(canonical)
+
+        # Constant-time comparison to prevent timing attacks
+        return hmac.compare_digest(computed_digest, expected_digest)
+
+    def verify_batch(self, messages: Iterable) -> List[bool]:
+        """
+        Verify the signatures of many PULSE messages.
+
+        Equivalent to calling verify_signature on each message, using
+        the signature stored in its envelope. One result is returned per
+        message, so a bad signature can be located in the batch.
+
+        Args:
+            messages: Iterable of PulseMessage instances to verify
+
+        Returns:
+            List of booleans, True where the signature is valid
+
+        Example:
+            >>> results = security.verify_batch([msg1, msg2, msg3])
+            >>> bad = [i for i, ok in enumerate(results) if not ok]
+        """
+        verify = self.verify_signature
+        return [verify(message) for message in messages]
 
     def _create_canonical_string(self, message) -> str:
         """
@@ -168,8 +253,6 @@ class SecurityManager:
         Returns:
             Canonical string representation
         """
-        import json
-
         # Create deterministic dict with sorted keys
         canonical_data = {
             'envelope': {
@@ -186,13 +269,13 @@ class SecurityManager:
         }
 
         # Use compact JSON with sorted keys for deterministic output
-        return json.dumps(canonical_data, sort_keys=True, separators=(',', ':'))
+        return _CANONICAL_ENCODER.encode(canonical_data)
 
     @staticmethod
     def check_replay_protection(
         message,
         max_age_seconds: int = 300,
-        nonce_store: Optional[set] = None
+        nonce_store: Optional[Union[set, "NonceStore"]] = None
     ) -> Dict[str, Any]:
         """
         Check message for replay attack indicators.
@@ -204,7 +287,8 @@ class SecurityManager:
         Args:
             message: PulseMessage to check
             max_age_seconds: Maximum message age in seconds (default 5 minutes)
-            nonce_store: Optional set of seen nonces for deduplication
+            nonce_store: Optional store of seen nonces for deduplication
+                         (a set, or a NonceStore to bound memory)
 
         Returns:
             Dictionary with check results:
@@ -244,10 +328,12 @@ class SecurityManager:
             if timestamp_str.endswith('Z'):
                 timestamp_str = timestamp_str[:-1] + '+00:00'
             message_time = datetime.fromisoformat(timestamp_str)
-            current_time = datetime.now(timezone.utc)
+            if message_time.tzinfo is None:
+                raise ValueError("timestamp has no UTC offset")
 
-            # Calculate age
-            age = (current_time - message_time).total_seconds()
+            # Calculate age against epoch seconds; cheaper than building an
+            # aware datetime for "now" and subtracting
+            age = time.time() - message_time.timestamp()
             result['age_seconds'] = age
 
             # Check if too old or from future
@@ -291,6 +377,74 @@ class SecurityManager:
         return result
 
 
+class NonceStore:
+    """
+    Time-bounded set of seen nonces for replay protection.
+
+    Drop-in replacement for the plain set accepted by
+    SecurityManager.check_replay_protection. A set grows for as long as
+    the process runs; NonceStore keeps nonces in two generations and
+    discards the older one every ttl_seconds, so memory is bounded by
+    the traffic seen in at most two periods.
+
+    A nonce is remembered for at least ttl_seconds. Set it to the
+    maximum accepted message age plus clock skew: older messages are
+    rejected by their timestamp before the nonce is consulted.
+
+    Example:
+        >>> nonce_store = NonceStore(ttl_seconds=360)
+        >>> SecurityManager.check_replay_protection(message, nonce_store=nonce_store)
+    """
+
+    def __init__(self, ttl_seconds: float = 360.0):
+        """
+        Initialize an empty nonce store.
+
+        Args:
+            ttl_seconds: Minimum time a nonce is remembered (default 6 minutes,
+                        the default 5 minute max age plus 60 seconds of skew)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._current: set = set()
+        self._previous: set = set()
+        self._rotated_at = time.monotonic()
+
+    def _rotate(self) -> None:
+        """Retire the current generation once ttl_seconds have passed."""
+        elapsed = time.monotonic() - self._rotated_at
+        if elapsed >= self.ttl_seconds:
+            # After two idle periods every stored nonce is past its ttl
+            self._previous = self._current if elapsed < 2 * self.ttl_seconds else set()
+            self._current = set()
+            self._rotated_at = time.monotonic()
+
+    def add(self, nonce: str) -> None:
+        """
+        Record a nonce as seen.
+
+        Args:
+            nonce: Message nonce
+        """
+        self._rotate()
+        self._current.add(nonce)
+
+    def __contains__(self, nonce: str) -> bool:
+        """Check whether a nonce was seen within the retention window."""
+        self._rotate()
+        return nonce in self._current or nonce in self._previous
+
+    def __len__(self) -> int:
+        """Return the number of nonces currently retained."""
+        self._rotate()
+        return len(self._current) + len(self._previous)
+
+    def clear(self) -> None:
+        """Forget all nonces."""
+        self._current = set()
+        self._previous = set()
+        self._rotated_at = time.monotonic()
+
+
 class KeyManager:
     """
     Manages security keys for PULSE Protocol.
@@ -23,16 +23,14 @@ Example:
     >>> server = PulseServer(port=8443, tls=tls)
     >>> server.start()
 """
-import json
 import ssl
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Optional, Dict, Any, Callable, List
-from datetime import datetime, timezone
 
-from pulse.message import PulseMessage
-from pulse.security import SecurityManager
-from pulse.encoder import JSONEncoder, BinaryEncoder
+from pulse.message import PulseMessage, _utc_timestamp
+from pulse.security import SecurityManager, NonceStore
+from pulse.encoder import JSONEncoder, BinaryEncoder, _json_dumps
 from pulse.validator import MessageValidator
 from pulse.exceptions import (
     NetworkError,
@@ -165,11 +163,9 @@ class PulseRequestHandler(BaseHTTPRequestHandler):
                 "security": server_config.get("security") is not None,
                 "handlers": list(server_config.get("handlers", {}).keys()),
                 "stats": server_config.get("stats", {}),
-                "timestamp": datetime.now(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z"),
+                "timestamp": _utc_timestamp(),
             }
-            body = json.dumps(health, indent=2).encode("utf-8")
+            body = _json_dumps(health, indent=2)
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(body)))
@@ -223,9 +219,7 @@ class PulseRequestHandler(BaseHTTPRequestHandler):
         error = PulseMessage.__new__(PulseMessage)
         error.envelope = {
             "version": "1.0",
-            "timestamp": datetime.now(timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
+            "timestamp": _utc_timestamp(),
             "sender": getattr(self.server, "pulse_config", {}).get(
                 "agent_id", "server"
             ),
@@ -241,7 +235,7 @@ class PulseRequestHandler(BaseHTTPRequestHandler):
             "parameters": {"error": message, "status_code": status},
         }
 
-        body = json.dumps(error.to_dict()).encode("utf-8")
+        body = JSONEncoder.encode(error, indent=None)
 
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
@@ -333,7 +327,7 @@ class PulseServer:
             "security": security,
             "require_signatures": require_signatures,
             "handlers": self._handlers,
-            "nonce_store": set() if enable_replay_protection else None,
+            "nonce_store": NonceStore() if enable_replay_protection else None,
             "encoding": "json",
             "verbose": verbose,
             "tls_enabled": tls is not None,
@@ -413,9 +407,7 @@ class PulseServer:
                 self._httpd.socket, server_side=True
             )
 
-        self._config["stats"]["started_at"] = (
-            datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        )
+        self._config["stats"]["started_at"] = _utc_timestamp()
 
         if blocking:
             try:
@@ -5,6 +5,7 @@ This module provides:
 - Self-signed certificate generation for development/testing
 - TLS context factory with secure defaults (TLS 1.2+)
 - Certificate utilities for production deployments
+- TLS session cache for client session resumption
 
 Security Layer 1 of the PULSE 7-layer security model.
 
@@ -23,7 +24,10 @@ Example:
 import os
 import ssl
 import tempfile
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
 from dataclasses import dataclass, field
 
 
@@ -165,6 +169,91 @@ class TLSConfig:
         return context
 
 
+class TLSSessionCache:
+    """
+    Bounded cache of TLS sessions for client-side session resumption.
+
+    Resuming a cached session on reconnect skips the certificate
+    exchange and key agreement of a full handshake. Entries expire
+    after ``ttl`` seconds; the least recently used entry is evicted
+    when the cache is full. Safe to share between threads.
+
+    Attributes:
+        maxsize: Maximum number of cached sessions
+        ttl: Seconds a session stays usable after it was stored
+
+    Example:
+        >>> cache = TLSSessionCache(maxsize=10, ttl=60)
+        >>> cache.put(("agent.example.com", 443), ssl_sock.session)
+        >>> session = cache.get(("agent.example.com", 443))
+    """
+
+    def __init__(self, maxsize: int = 100, ttl: float = 300.0) -> None:
+        """
+        Initialize the session cache.
+
+        Args:
+            maxsize: Maximum number of cached sessions (default 100)
+            ttl: Session lifetime in seconds (default 300)
+
+        Raises:
+            ValueError: If maxsize is less than 1 or ttl is not positive
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._sessions: "OrderedDict[Hashable, Tuple[ssl.SSLSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ssl.SSLSession]:
+        """
+        Get the cached session for a key.
+
+        Args:
+            key: Cache key, typically (host, port)
+
+        Returns:
+            Cached session, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return None
+            session, expires = entry
+            if time.monotonic() >= expires:
+                del self._sessions[key]
+                return None
+            self._sessions.move_to_end(key)
+            return session
+
+    def put(self, key: Hashable, session: ssl.SSLSession) -> None:
+        """
+        Store a session, replacing any previous one for the key.
+
+        Args:
+            key: Cache key, typically (host, port)
+            session: Session from a connected SSL socket
+        """
+        with self._lock:
+            self._sessions[key] = (session, time.monotonic() + self.ttl)
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached sessions."""
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached sessions, including expired ones."""
+        return len(self._sessions)
+
+
 def generate_self_signed_cert(
     hostname: str = "localhost",
     org_name: str = "PULSE Protocol Dev",
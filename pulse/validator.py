@@ -4,6 +4,8 @@ from typing import Dict, Any
 from pulse.vocabulary import Vocabulary
 from pulse.exceptions import ValidationError
 
+_REQUIRED_ENVELOPE_FIELDS = ("version", "timestamp", "sender", "receiver", "message_id", "nonce")
+
 
 class MessageValidator:
     """
@@ -41,10 +43,8 @@ class MessageValidator:
             >>> MessageValidator.validate_envelope(envelope)
             True
         """
-        required_fields = ["version", "timestamp", "sender", "receiver", "message_id", "nonce"]
-
         # Check all required fields exist
-        for field in required_fields:
+        for field in _REQUIRED_ENVELOPE_FIELDS:
             if field not in envelope:
                 raise ValidationError(f"Missing required envelope field: {field}")
 
@@ -107,7 +107,7 @@ class MessageValidator:
             raise ValidationError("Action cannot be empty")
 
         # Validate action is a valid vocabulary concept
-        if not Vocabulary.validate_concept(action):
+        if action not in Vocabulary.CONCEPT_SET:
             suggestions = Vocabulary.search(action.split(".")[-1] if "." in action else action)
             if suggestions:
                 raise ValidationError(
@@ -124,7 +124,7 @@ class MessageValidator:
             if len(obj.strip()) == 0:
                 raise ValidationError("Object cannot be empty string")
 
-            if not Vocabulary.validate_concept(obj):
+            if obj not in Vocabulary.CONCEPT_SET:
                 suggestions = Vocabulary.search(obj.split(".")[-1] if "." in obj else obj)
                 if suggestions:
                     raise ValidationError(
@@ -3,7 +3,9 @@
 This module contains all 1,000 semantic concepts organized into 10 categories.
 Each concept has a unique identifier, category, subcategory, description, and examples.
 """
-from typing import List, Dict, Optional, Set
+import sys
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
 
 
 class Vocabulary:
@@ -6129,6 +6131,55 @@ class Vocabulary:
         },
     }
 
+    # Dotted IDs are not interned automatically; interning them lets
+    # lookups and comparisons against interned strings short-circuit on identity
+    CONCEPTS = {sys.intern(concept): data for concept, data in CONCEPTS.items()}
+
+    # Immutable set of concept IDs for membership checks on the validation hot path
+    CONCEPT_SET: FrozenSet[str] = frozenset(CONCEPTS)
+
+    # Derived indexes, built on first use (see _build_indexes)
+    _category_index: Optional[Dict[str, List[str]]] = None
+    _prefix_index: Optional[Dict[str, List[str]]] = None
+    _search_index: Optional[List[Tuple[str, str]]] = None
+    _concept_index: Optional[Dict[str, int]] = None
+    _concepts_by_index: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def _build_indexes(cls) -> None:
+        """
+        Build category, prefix, search and integer indexes from CONCEPTS.
+
+        The search index pairs each concept with one lowercased haystack
+        holding its ID, description and examples joined by NUL, so a
+        query is a single substring test per concept. A NUL-free query
+        cannot match across field boundaries.
+        """
+        if cls._category_index is not None:
+            return
+
+        category_index: Dict[str, List[str]] = {}
+        prefix_index: Dict[str, List[str]] = {}
+        search_index = []
+        for concept, data in cls.CONCEPTS.items():
+            category_index.setdefault(data["category"], []).append(concept)
+
+            parts = concept.split(".")
+            for i in range(1, len(parts) + 1):
+                prefix_index.setdefault(".".join(parts[:i]), []).append(concept)
+
+            fields = [concept, data["description"], *data["examples"]]
+            search_index.append((concept, "\x00".join(fields).lower()))
+
+        # Integer indexes follow sorted concept order; CompactEncoder puts
+        # them on the wire, so the ordering must stay stable
+        concepts_by_index = tuple(sorted(cls.CONCEPTS))
+        cls._concepts_by_index = concepts_by_index
+        cls._concept_index = {concept: i for i, concept in enumerate(concepts_by_index)}
+
+        cls._search_index = search_index
+        cls._prefix_index = prefix_index
+        cls._category_index = category_index
 
     @classmethod
     def validate_concept(cls, concept: str) -> bool:
@@ -6147,7 +6198,7 @@ class Vocabulary:
             >>> Vocabulary.validate_concept("INVALID.CONCEPT")
             False
         """
-        return concept in cls.CONCEPTS
+        return concept in cls.CONCEPT_SET
 
     @classmethod
     def get_category(cls, concept: str) -> Optional[str]:
@@ -6164,8 +6215,45 @@ class Vocabulary:
             >>> Vocabulary.get_category("ACT.QUERY.DATA")
             'ACT'
         """
-        if concept in cls.CONCEPTS:
-            return cls.CONCEPTS[concept]["category"]
+        data = cls.CONCEPTS.get(concept)
+        return data["category"] if data is not None else None
+
+    @classmethod
+    def get_concept_index(cls, concept: str) -> Optional[int]:
+        """
+        Get the integer index of a concept.
+
+        Indexes are positions in the sorted list of concepts, so they are
+        dense (0 to get_total_count() - 1) and stable for a given vocabulary.
+
+        Args:
+            concept: Concept identifier
+
+        Returns:
+            Integer index or None if not found
+
+        Example:
+            >>> index = Vocabulary.get_concept_index("ACT.QUERY.DATA")
+            >>> Vocabulary.get_concept_by_index(index)
+            'ACT.QUERY.DATA'
+        """
+        cls._build_indexes()
+        return cls._concept_index.get(concept)
+
+    @classmethod
+    def get_concept_by_index(cls, index: int) -> Optional[str]:
+        """
+        Get the concept at an integer index.
+
+        Args:
+            index: Index returned by get_concept_index
+
+        Returns:
+            Concept identifier or None if out of range
+        """
+        cls._build_indexes()
+        if 0 <= index < len(cls._concepts_by_index):
+            return cls._concepts_by_index[index]
         return None
 
     @classmethod
@@ -6183,9 +6271,8 @@ class Vocabulary:
             >>> Vocabulary.get_description("ACT.QUERY.DATA")
             'Query for data or information'
         """
-        if concept in cls.CONCEPTS:
-            return cls.CONCEPTS[concept]["description"]
-        return None
+        data = cls.CONCEPTS.get(concept)
+        return data["description"] if data is not None else None
 
     @classmethod
     def get_examples(cls, concept: str) -> List[str]:
@@ -6202,9 +6289,8 @@ class Vocabulary:
             >>> Vocabulary.get_examples("ACT.QUERY.DATA")
             ['select', 'get', 'fetch']
         """
-        if concept in cls.CONCEPTS:
-            return cls.CONCEPTS[concept]["examples"]
-        return []
+        data = cls.CONCEPTS.get(concept)
+        return data["examples"] if data is not None else []
 
     @classmethod
     def search(cls, query: str) -> List[str]:
@@ -6224,26 +6310,25 @@ class Vocabulary:
             >>> print(results)
             ['ACT.ANALYZE.SENTIMENT']
         """
-        query_lower = query.lower()
-        results = []
+        return list(cls._search_cached(query.lower()))
 
-        for concept, data in cls.CONCEPTS.items():
-            # Search in concept ID
-            if query_lower in concept.lower():
-                results.append(concept)
-                continue
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _search_cached(cls, query_lower: str) -> Tuple[str, ...]:
+        """
+        Search the lowercased index (results cached per query).
 
-            # Search in description
-            if query_lower in data["description"].lower():
-                results.append(concept)
-                continue
+        Args:
+            query_lower: Lowercased search query
 
-            # Search in examples
-            if any(query_lower in ex.lower() for ex in data["examples"]):
-                results.append(concept)
-                continue
+        Returns:
+            Tuple of matching concept identifiers
+        """
+        if "\x00" in query_lower:
+            return ()  # Field separator; no concept text contains it
 
-        return results
+        cls._build_indexes()
+        return tuple(concept for concept, haystack in cls._search_index if query_lower in haystack)
 
     @classmethod
     def list_by_category(cls, category: str) -> List[str]:
@@ -6261,9 +6346,29 @@ class Vocabulary:
             >>> len(actions) >= 200
             True
         """
-        return [
-            concept for concept, data in cls.CONCEPTS.items() if data["category"] == category
-        ]
+        cls._build_indexes()
+        return list(cls._category_index.get(category, ()))
+
+    @classmethod
+    def list_by_prefix(cls, prefix: str) -> List[str]:
+        """
+        List all concepts under a dotted prefix.
+
+        Matches whole segments: "ACT.ANALYZE" matches "ACT.ANALYZE.SENTIMENT"
+        but not "ACT.ANALYZER". A concept equal to the prefix is included.
+
+        Args:
+            prefix: Dotted concept prefix (e.g., "ACT.ANALYZE", "ENT.DATA")
+
+        Returns:
+            List of concept identifiers under the prefix
+
+        Example:
+            >>> "ACT.ANALYZE.SENTIMENT" in Vocabulary.list_by_prefix("ACT.ANALYZE")
+            True
+        """
+        cls._build_indexes()
+        return list(cls._prefix_index.get(prefix.rstrip("."), ()))
 
     @classmethod
     def get_all_categories(cls) -> Set[str]:
@@ -6278,7 +6383,8 @@ class Vocabulary:
             >>> print(sorted(categories))
             ['ACT', 'DATA', 'ENT', 'LOG', 'MATH', 'META', 'PROP', 'REL', 'SPACE', 'TIME']
         """
-        return {data["category"] for data in cls.CONCEPTS.values()}
+        cls._build_indexes()
+        return set(cls._category_index)
 
     @classmethod
     def count_by_category(cls) -> Dict[str, int]:
@@ -6293,11 +6399,8 @@ class Vocabulary:
             >>> counts["ACT"] >= 200
             True
         """
-        counts: Dict[str, int] = {}
-        for data in cls.CONCEPTS.values():
-            cat = data["category"]
-            counts[cat] = counts.get(cat, 0) + 1
-        return counts
+        cls._build_indexes()
+        return {cat: len(concepts) for cat, concepts in cls._category_index.items()}
 
     @classmethod
     def get_total_count(cls) -> int:
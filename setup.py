@@ -38,6 +38,13 @@ setup(
         "msgpack>=1.0.0",
     ],
     extras_require={
+        "fast": [
+            "ormsgpack>=1.4.0",
+            "orjson>=3.6.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
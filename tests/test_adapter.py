@@ -134,6 +134,30 @@ class TestAdapterInit:
         assert "echo.example.com" in repr_str
         assert "False" in repr_str  # connected=False
 
+    def test_slotted_subclass_has_no_dict(self):
+        """Test that subclasses declaring __slots__ drop the instance __dict__."""
+
+        class SlottedAdapter(PulseAdapter):
+            __slots__ = ()
+
+            def to_native(self, message):
+                return message.content["parameters"]
+
+            def call_api(self, native_request):
+                return native_request
+
+            def from_native(self, native_response):
+                return PulseMessage(action="ACT.RESPOND", validate=False)
+
+        adapter = SlottedAdapter(name="slotted")
+        assert not hasattr(adapter, "__dict__")
+        assert adapter.send(PulseMessage(action="ACT.QUERY.DATA")).envelope["sender"] == "adapter:slotted"
+
+    def test_subclass_attributes_still_allowed(self, echo_adapter):
+        """Test that subclasses without __slots__ can set their own attributes."""
+        echo_adapter.api_key = "secret"
+        assert echo_adapter.api_key == "secret"
+
 
 # --- Test Send Pipeline ---
 
@@ -150,6 +174,15 @@ class TestAdapterSend:
         assert response.envelope["receiver"] == "test-agent"
         assert response.envelope["sender"] == "adapter:echo"
 
+    def test_send_uses_renamed_adapter(self, echo_adapter, sample_message):
+        """Test that renaming an adapter updates the response sender."""
+        echo_adapter.name = "echo-2"
+        response = echo_adapter.send(sample_message)
+        error = echo_adapter.create_error_response("META.ERROR.INTERNAL", "boom")
+
+        assert response.envelope["sender"] == "adapter:echo-2"
+        assert error.envelope["sender"] == "adapter:echo-2"
+
     def test_send_preserves_data(self, echo_adapter, sample_message):
         """Test that send preserves request data in response."""
         response = echo_adapter.send(sample_message)
@@ -354,6 +387,23 @@ class TestSupportedActions:
         assert adapter.supports("ACT.QUERY.DATA") is True
         assert adapter.supports("ANYTHING") is True
 
+    def test_supported_actions_read_once(self):
+        """Test that supports() caches supported_actions after the first call."""
+
+        class CountingAdapter(EchoAdapter):
+            reads = 0
+
+            @property
+            def supported_actions(self):
+                CountingAdapter.reads += 1
+                return super().supported_actions
+
+        adapter = CountingAdapter(name="counting")
+        for _ in range(10):
+            assert adapter.supports("ACT.QUERY.DATA") is True
+            assert adapter.supports("ACT.CREATE.TEXT") is False
+        assert CountingAdapter.reads == 1
+
 
 # --- Test Exception Classes ---
 
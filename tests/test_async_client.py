@@ -0,0 +1,279 @@
+"""Tests for the PULSE asyncio client."""
+import asyncio
+import socket
+import time
+
+import pytest
+
+from pulse import AsyncPulseClient
+from pulse.message import PulseMessage
+from pulse.server import PulseServer
+from pulse.exceptions import NetworkError
+
+
+@pytest.fixture
+def server_port():
+    """Get a free port for testing."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def echo_server(server_port):
+    """Start a server that echoes request parameters."""
+    server = PulseServer(host="127.0.0.1", port=server_port, agent_id="async-server")
+
+    def echo_handler(message):
+        response = PulseMessage(action="ACT.RESPOND", validate=False)
+        response.type = "RESPONSE"
+        response.content["parameters"] = message.content.get("parameters", {})
+        return response
+
+    server.add_handler("*", echo_handler)
+    server.start(blocking=False)
+    time.sleep(0.2)
+    yield server
+    server.stop()
+
+
+class TestAsyncPulseClient:
+    """Test AsyncPulseClient against a live server."""
+
+    def test_send(self, echo_server, server_port):
+        """Test a single awaited send."""
+        async def run():
+            async with AsyncPulseClient(f"http://127.0.0.1:{server_port}", timeout=5) as client:
+                return await client.send(
+                    PulseMessage(action="ACT.QUERY.DATA", parameters={"n": 1})
+                )
+
+        response = asyncio.run(run())
+        assert response.type == "RESPONSE"
+        assert response.content["parameters"] == {"n": 1}
+
+    def test_send_many_preserves_order(self, echo_server, server_port):
+        """Test concurrent sends return responses in message order."""
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"seq": i}) for i in range(8)
+        ]
+
+        async def run():
+            async with AsyncPulseClient(
+                f"http://127.0.0.1:{server_port}", max_concurrency=4, encoding="binary"
+            ) as client:
+                responses = await client.send_many(messages)
+                return responses, client.stats
+
+        responses, stats = asyncio.run(run())
+        assert [r.content["parameters"]["seq"] for r in responses] == list(range(8))
+        assert stats["messages_sent"] == 8
+
+    def test_ping_and_fire_and_forget(self, echo_server, server_port):
+        """Test the awaitable ping and fire-and-forget calls."""
+        async def run():
+            async with AsyncPulseClient(f"http://127.0.0.1:{server_port}") as client:
+                status = PulseMessage(action="ACT.QUERY.DATA")
+                status.type = "STATUS"
+                return await client.ping(), await client.send_fire_and_forget(status)
+
+        health, accepted = asyncio.run(run())
+        assert health["status"] == "healthy"
+        assert accepted is True
+
+    def test_send_many_return_exceptions(self):
+        """Test failures can be collected instead of raised."""
+        async def run():
+            async with AsyncPulseClient(
+                "http://127.0.0.1:19999", max_retries=1, timeout=1
+            ) as client:
+                with pytest.raises(NetworkError):
+                    await client.send_many([PulseMessage(action="ACT.QUERY.DATA")])
+                return await client.send_many(
+                    [PulseMessage(action="ACT.QUERY.DATA")] * 2, return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+        assert len(results) == 2
+        assert all(isinstance(r, NetworkError) for r in results)
+
+    def test_http2_transport(self, echo_server, server_port):
+        """Test sending through the httpx transport (HTTP/1.1 to a plain-HTTP server)."""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"seq": i}) for i in range(4)
+        ]
+
+        async def run():
+            async with AsyncPulseClient(
+                f"http://127.0.0.1:{server_port}", http2=True, timeout=5
+            ) as client:
+                return await client.send_many(messages), client.stats
+
+        responses, stats = asyncio.run(run())
+        assert [r.content["parameters"]["seq"] for r in responses] == list(range(4))
+        assert stats["messages_sent"] == 4
+
+    def test_http2_concurrency_limit(self):
+        """Test HTTP/2 sends keep at most max_concurrency requests in flight."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        from pulse.encoder import JSONEncoder
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.02)
+            in_flight["now"] -= 1
+            response = PulseMessage(action="ACT.RESPOND", validate=False)
+            response.type = "RESPONSE"
+            return httpx.Response(200, content=JSONEncoder.encode(response, indent=None))
+
+        async def run():
+            async with AsyncPulseClient(
+                "https://agent.example.com", http2=True, max_concurrency=3
+            ) as client:
+                # Serve from a mock transport; the limit under test is the
+                # client's own, not httpx's connection limit
+                await client._http.aclose()
+                client._http = httpx.AsyncClient(
+                    base_url=client.client.base_url, transport=httpx.MockTransport(handler)
+                )
+                messages = [PulseMessage(action="ACT.QUERY.DATA") for _ in range(10)]
+                responses = await client.send_many(messages)
+                status = PulseMessage(action="ACT.QUERY.DATA")
+                status.type = "STATUS"
+                accepted = await asyncio.gather(
+                    *(client.send_fire_and_forget(status) for _ in range(10))
+                )
+                return responses, accepted
+
+        responses, accepted = asyncio.run(run())
+        assert len(responses) == 10
+        assert all(accepted)
+        assert in_flight["max"] == 3
+
+    def test_http2_redirect_is_an_error(self):
+        """Test the httpx transport treats 3xx like PulseClient does."""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(301)
+                self.send_header("Location", "http://elsewhere.example/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        httpd = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        try:
+            async def run():
+                async with AsyncPulseClient(
+                    f"http://127.0.0.1:{httpd.server_address[1]}", http2=True, timeout=5
+                ) as client:
+                    with pytest.raises(NetworkError, match="301.*elsewhere.example"):
+                        await client.send(PulseMessage(action="ACT.QUERY.DATA"))
+                    return client.stats
+
+            stats = asyncio.run(run())
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+        assert stats["retries_total"] == 0
+
+    def test_http2_ssl_context_is_private(self):
+        """Test the httpx transport never gets the shared default SSL context."""
+        import ssl
+        from pulse.client import _default_ssl_context
+        from pulse.tls import TLSConfig
+
+        for verify in (True, False):
+            context = AsyncPulseClient._create_http2_ssl_context({"verify_ssl": verify})
+            assert context is not _default_ssl_context(verify)
+            assert context.check_hostname is verify
+
+        tls_context = AsyncPulseClient._create_http2_ssl_context(
+            {"tls": TLSConfig(), "verify_ssl": False}
+        )
+        assert isinstance(tls_context, ssl.SSLContext)
+        assert tls_context.verify_mode == ssl.CERT_NONE
+
+    def test_http2_over_tls_leaves_shared_context_alone(self, monkeypatch):
+        """Test HTTP/2 over TLS does not set ALPN on the shared SSL context."""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        import ssl
+        from pulse.client import PulseClient, _default_ssl_context
+        from pulse.tls import TLSConfig, generate_self_signed_cert
+
+        alpn_contexts = []
+        set_alpn_protocols = ssl.SSLContext.set_alpn_protocols
+
+        def recording_set_alpn_protocols(context, protocols):
+            alpn_contexts.append(context)
+            return set_alpn_protocols(context, protocols)
+
+        monkeypatch.setattr(ssl.SSLContext, "set_alpn_protocols", recording_set_alpn_protocols)
+
+        cert_path, key_path = generate_self_signed_cert(hostname="localhost")
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        server = PulseServer(
+            host="127.0.0.1", port=port, tls=TLSConfig(certfile=cert_path, keyfile=key_path)
+        )
+        server.add_handler("*", lambda message: message)
+        server.start(blocking=False)
+        time.sleep(0.2)
+        try:
+            async def run():
+                async with AsyncPulseClient(
+                    f"https://localhost:{port}", http2=True, verify_ssl=False, timeout=5
+                ) as client:
+                    return await client.send(PulseMessage(action="ACT.QUERY.DATA"))
+
+            asyncio.run(run())
+            sync_client = PulseClient(f"https://localhost:{port}", verify_ssl=False)
+            assert sync_client.ping()["status"] == "healthy"
+        finally:
+            server.stop()
+
+        assert alpn_contexts
+        assert _default_ssl_context(False) not in alpn_contexts
+        assert _default_ssl_context(True) not in alpn_contexts
+
+    def test_http2_requires_httpx(self):
+        """Test http2=True without httpx[http2] raises a helpful ImportError."""
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("httpx[http2] is installed")
+
+        with pytest.raises(ImportError, match=r"pulse-protocol\[http2\]"):
+            AsyncPulseClient("https://example.com", http2=True)
+
+    def test_invalid_concurrency(self):
+        """Test that max_concurrency below 1 is rejected."""
+        with pytest.raises(ValueError):
+            AsyncPulseClient("http://127.0.0.1:19999", max_concurrency=0)
+
+    def test_repr(self):
+        """Test string representation."""
+        client = AsyncPulseClient("https://example.com", max_concurrency=3)
+        assert repr(client) == (
+            "AsyncPulseClient(base_url='https://example.com', "
+            "encoding='json', max_concurrency=3)"
+        )
@@ -0,0 +1,137 @@
+"""Tests for PULSE performance benchmarks."""
+import pytest
+from pulse.benchmarks import BenchmarkResult, PerformanceBenchmarks
+
+
+class TestBenchmarkResult:
+    """Test benchmark result statistics."""
+
+    def test_add_time(self):
+        """Test single-call measurements."""
+        result = BenchmarkResult("single")
+        result.add_time(0.5)
+        result.add_time(1.5)
+
+        stats = result.get_stats()
+        assert stats['iterations'] == 2
+        assert stats['total_time'] == pytest.approx(2.0)
+        assert stats['mean'] == pytest.approx(1.0)
+        assert stats['ops_per_sec'] == pytest.approx(1.0)
+
+    def test_add_batch(self):
+        """Test batch measurements count every call."""
+        result = BenchmarkResult("batch")
+        result.add_batch(1.0, 10)
+        result.add_batch(3.0, 10)
+
+        stats = result.get_stats()
+        assert result.times == pytest.approx([0.1, 0.3])
+        assert stats['iterations'] == 20
+        assert stats['total_time'] == pytest.approx(4.0)
+        assert stats['mean'] == pytest.approx(0.2)
+        assert stats['ops_per_sec'] == pytest.approx(5.0)
+
+    def test_stats_match_statistics_module(self):
+        """Test spread statistics against the statistics module."""
+        import random
+        import statistics
+
+        result = BenchmarkResult("spread")
+        for _ in range(200):
+            result.add_time(random.uniform(1e-7, 1e-5))
+
+        stats = result.get_stats()
+        assert stats['median'] == statistics.median(result.times)
+        assert stats['stdev'] == pytest.approx(statistics.stdev(result.times), rel=1e-9)
+
+    def test_empty_result(self):
+        """Test result with no measurements."""
+        assert BenchmarkResult("empty").get_stats() == {}
+
+
+class TestPerformanceBenchmarks:
+    """Test the benchmark runner."""
+
+    @pytest.mark.parametrize("iterations", [1, 7, 250, 1000, 10199])
+    def test_benchmark_call_count(self, iterations):
+        """Test that the function runs exactly `iterations` times after warmup."""
+        calls = []
+        benchmarks = PerformanceBenchmarks(iterations=iterations)
+        result = benchmarks.benchmark("count", calls.append, None)
+
+        warmup = min(10, iterations // 10)
+        assert len(calls) == warmup + iterations
+        assert result.iterations == iterations
+        assert 1 <= len(result.times) <= 200
+        assert benchmarks.results["count"] is result
+
+    @pytest.mark.parametrize("iterations", [0, -5])
+    def test_benchmark_rejects_no_iterations(self, iterations):
+        """Test that a benchmark needs at least one iteration."""
+        calls = []
+        benchmarks = PerformanceBenchmarks(iterations=iterations)
+        with pytest.raises(ValueError, match="iterations"):
+            benchmarks.benchmark("none", calls.append, None)
+        assert calls == []
+        assert "none" not in benchmarks.results
+
+    def test_benchmark_passes_arguments(self):
+        """Test that positional and keyword arguments reach the function."""
+        seen = []
+        benchmarks = PerformanceBenchmarks(iterations=20)
+        benchmarks.benchmark("args", lambda a, b=None: seen.append((a, b)), 1, b=2)
+
+        assert seen and set(seen) == {(1, 2)}
+
+    def test_run_all_in_worker_processes(self, capsys):
+        """Test that parallel runs collect the same benchmarks as serial runs."""
+        serial = PerformanceBenchmarks(iterations=10)
+        serial.run_all()
+        serial_output = capsys.readouterr().out
+
+        parallel = PerformanceBenchmarks(iterations=10)
+        parallel.run_all(workers=2)
+        parallel_output = capsys.readouterr().out
+
+        assert list(parallel.results) == list(serial.results)
+        assert all(r.iterations == 10 for r in parallel.results.values())
+
+        def headings(output):
+            return [line for line in output.splitlines() if line.startswith("===")]
+
+        assert headings(parallel_output) == headings(serial_output)
+
+    def test_cpu_time_clock(self, monkeypatch):
+        """Test that cpu_time=True times batches with the thread CPU clock."""
+        import time
+
+        ticks = iter(range(0, 10**9, 1000))
+        monkeypatch.setattr(time, "thread_time_ns", lambda: next(ticks))
+
+        result = PerformanceBenchmarks(iterations=5, cpu_time=True).benchmark("cpu", lambda: None)
+        assert result.times == pytest.approx([1e-6] * 5)
+
+    @pytest.mark.skipif(not hasattr(__import__("os"), "sched_setaffinity"), reason="Linux only")
+    def test_pin_cpu_restores_affinity(self, capsys):
+        """Test that run_all pins to one CPU and restores the affinity afterwards."""
+        import os
+
+        before = os.sched_getaffinity(0)
+        cpu = min(before)
+        seen = []
+
+        class Probe(PerformanceBenchmarks):
+            GROUPS = ("probe",)
+
+            def probe(self):
+                seen.append(os.sched_getaffinity(0))
+
+        Probe(iterations=1, pin_cpu=cpu).run_all()
+
+        assert seen == [{cpu}]
+        assert os.sched_getaffinity(0) == before
+
+    def test_pin_cpu_rejects_workers(self):
+        """Test that pinning cannot be combined with worker processes."""
+        with pytest.raises(ValueError):
+            PerformanceBenchmarks(iterations=1, pin_cpu=0).run_all(workers=2)
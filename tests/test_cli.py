@@ -10,6 +10,8 @@ from pulse.cli import (
     verify_signature_command,
     encode_message_command,
     decode_message_command,
+    batch_command,
+    main,
 )
 from pulse import PulseMessage
 
@@ -277,6 +279,29 @@ class TestEncodeCommand:
         result = encode_message_command(args)
         assert result == 0
 
+    def test_encode_to_compact_and_decode(self, tmp_path):
+        """Test compact encoding round trip through the CLI."""
+        message = PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"query": "test"}, validate=False
+        )
+        input_file = tmp_path / "message.json"
+        input_file.write_text(message.to_json())
+
+        args = Args(file=str(input_file), format="compact", output=None, compare=False)
+        assert encode_message_command(args) == 0
+
+        compact_file = tmp_path / "message.pulse"
+        assert compact_file.read_bytes()[0] == 0xAE
+        assert compact_file.stat().st_size < input_file.stat().st_size
+
+        decoded_file = tmp_path / "decoded.json"
+        args = Args(file=str(compact_file), format=None, output=str(decoded_file), indent=2)
+        assert decode_message_command(args) == 0
+
+        decoded = PulseMessage.from_json(decoded_file.read_bytes())
+        assert decoded.content["action"] == "ACT.QUERY.DATA"
+        assert decoded.content["parameters"] == {"query": "test"}
+
 
 class TestDecodeCommand:
     """Test decode command."""
@@ -324,6 +349,150 @@ class TestDecodeCommand:
         assert result == 0
 
 
+class TestLargeInput:
+    """Test memory-mapped reading of large input files."""
+
+    @pytest.fixture
+    def large_message(self):
+        return PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"blob": "x" * 100_000}, validate=False
+        )
+
+    @pytest.mark.parametrize("fmt", ["binary", "json", "compact"])
+    def test_decode_large_file(self, tmp_path, large_message, fmt):
+        """Test decoding files above the mmap threshold."""
+        from pulse import Encoder
+        from pulse.cli import MMAP_THRESHOLD
+
+        input_file = tmp_path / "large.bin"
+        input_file.write_bytes(Encoder().encode(large_message, format=fmt))
+        assert input_file.stat().st_size >= MMAP_THRESHOLD
+
+        output_file = tmp_path / "decoded.json"
+        args = Args(file=str(input_file), format=None, output=str(output_file), indent=None)
+        assert decode_message_command(args) == 0
+
+        decoded = PulseMessage.from_json(output_file.read_bytes())
+        assert decoded.content["parameters"] == large_message.content["parameters"]
+
+    def test_validate_large_file(self, tmp_path, large_message):
+        """Test validating a JSON file above the mmap threshold."""
+        input_file = tmp_path / "large.json"
+        input_file.write_text(large_message.to_json())
+
+        args = Args(file=str(input_file), check_freshness=False)
+        assert validate_message_command(args) == 0
+
+    def test_decode_corrupt_large_file(self, tmp_path):
+        """Test that a corrupt large file reports an error instead of crashing."""
+        input_file = tmp_path / "corrupt.bin"
+        input_file.write_bytes(b"\xc1" * 100_000)
+
+        args = Args(file=str(input_file), format="binary", output=None, indent=2)
+        assert decode_message_command(args) == 1
+
+
+class TestCompactOutput:
+    """Test --compact JSON output."""
+
+    def test_compact_flag_writes_single_line(self, tmp_path):
+        """Test that --compact writes JSON without whitespace."""
+        output_file = tmp_path / "message.json"
+        assert main([
+            "create", "--action", "ACT.QUERY.DATA", "--compact", "-o", str(output_file)
+        ]) == 0
+
+        content = output_file.read_text()
+        assert "\n" not in content
+        assert ": " not in content
+        assert PulseMessage.from_json(content).content["action"] == "ACT.QUERY.DATA"
+
+    def test_stdout_output(self, capsysbinary):
+        """Test that JSON printed to stdout is valid UTF-8 with a trailing newline."""
+        assert main([
+            "create", "--action", "ACT.QUERY.DATA", "--compact",
+            "--parameters", '{"text": "h\u00e9llo"}',
+        ]) == 0
+
+        out = capsysbinary.readouterr().out
+        assert out.endswith(b"}\n") and out.count(b"\n") == 1
+        message = PulseMessage.from_json(out)
+        assert message.content["parameters"]["text"] == "h\u00e9llo"
+
+    def test_default_output_is_indented(self, tmp_path):
+        """Test that output stays indented by default."""
+        output_file = tmp_path / "message.json"
+        assert main(["create", "--action", "ACT.QUERY.DATA", "-o", str(output_file)]) == 0
+        assert '\n  "envelope"' in output_file.read_text()
+
+
+class TestBatchCommand:
+    """Test batch command."""
+
+    def test_batch_runs_commands_in_order(self, tmp_path):
+        """Test that each line runs as a CLI command, sharing one process."""
+        message_file = tmp_path / "message.json"
+        signed_file = tmp_path / "signed.json"
+        commands = tmp_path / "commands.txt"
+        commands.write_text(
+            "# build and sign one message\n"
+            f"create --action ACT.QUERY.DATA --parameters '{{\"id\": 1}}' -o {message_file}\n"
+            "\n"
+            f"sign {message_file} --key 'k#1' -o {signed_file}\n"
+            f"verify {signed_file} --key 'k#1'\n"
+        )
+
+        assert batch_command(Args(file=str(commands), fail_fast=False)) == 0
+
+        signed = PulseMessage.from_json(signed_file.read_text())
+        assert signed.content['parameters'] == {"id": 1}
+        assert signed.envelope['signature'] is not None
+
+    def test_batch_reports_failures(self, tmp_path, capsys):
+        """Test that failing lines are counted and later lines still run."""
+        message_file = tmp_path / "message.json"
+        commands = tmp_path / "commands.txt"
+        commands.write_text(
+            f"validate {tmp_path / 'missing.json'}\n"
+            "unknown-command\n"
+            "batch other.txt\n"
+            f"create --action ACT.QUERY.DATA -o {message_file}\n"
+        )
+
+        assert batch_command(Args(file=str(commands), fail_fast=False)) == 1
+        assert message_file.exists()
+        assert "3 command(s) failed" in capsys.readouterr().err
+
+    def test_batch_fail_fast(self, tmp_path):
+        """Test that --fail-fast stops at the first failing line."""
+        message_file = tmp_path / "message.json"
+        commands = tmp_path / "commands.txt"
+        commands.write_text(
+            f"validate {tmp_path / 'missing.json'}\n"
+            f"create --action ACT.QUERY.DATA -o {message_file}\n"
+        )
+
+        assert batch_command(Args(file=str(commands), fail_fast=True)) == 1
+        assert not message_file.exists()
+
+    def test_batch_from_stdin(self, tmp_path, monkeypatch):
+        """Test that `pulse batch` reads commands from stdin by default."""
+        import io
+
+        message_file = tmp_path / "message.json"
+        monkeypatch.setattr(
+            "sys.stdin", io.StringIO(f"create --action ACT.QUERY.DATA -o {message_file}\n")
+        )
+
+        assert main(["batch"]) == 0
+        assert message_file.exists()
+
+    def test_batch_missing_file(self, tmp_path):
+        """Test batch with a missing command file."""
+        args = Args(file=str(tmp_path / "missing.txt"), fail_fast=False)
+        assert batch_command(args) == 1
+
+
 class TestCLIIntegration:
     """Integration tests for CLI commands."""
 
@@ -384,3 +553,41 @@ class TestCLIIntegration:
         assert decoded.content['action'] == "ACT.QUERY.DATA"
         assert decoded.content['parameters']['query'] == "test"
         assert decoded.envelope['signature'] is not None
+
+    def test_cli_import_defers_security_and_encoder(self):
+        """Test importing the CLI does not load security or encoder modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, pulse.cli\n"
+            "assert 'pulse.security' not in sys.modules\n"
+            "assert 'pulse.encoder' not in sys.modules\n"
+            "assert 'msgpack' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_create_and_validate_skip_security_and_msgpack(self, tmp_path):
+        """Test JSON-only commands load neither the security module nor MessagePack."""
+        import subprocess
+        import sys
+
+        message_file = str(tmp_path / "message.json")
+        code = (
+            "import sys\n"
+            "from pulse.cli import main\n"
+            f"assert main(['create', '--action', 'ACT.QUERY.DATA', '-o', {message_file!r}]) == 0\n"
+            f"assert main(['validate', {message_file!r}]) == 0\n"
+            "assert 'pulse.security' not in sys.modules\n"
+            "assert 'msgpack' not in sys.modules\n"
+            "assert 'ormsgpack' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -270,3 +270,13 @@ class TestCompactEncoderHelpers:
 
         # Should match to the second (microsecond rounding may differ)
         assert restored.startswith("2026-02-20T12:00:00")
+
+    def test_timestamp_roundtrip_exact(self):
+        """Test that envelope-style timestamps survive conversion unchanged."""
+        for original in (
+            "2026-02-20T12:00:00.000000Z",
+            "2026-02-20T12:00:00.000001Z",
+            "1999-12-31T23:59:59.999999Z",
+        ):
+            micros = CompactEncoder._timestamp_to_micros(original)
+            assert CompactEncoder._micros_to_timestamp(micros) == original
@@ -1,7 +1,7 @@
 """Tests for PULSE message encoding/decoding."""
 import pytest
 from pulse import PulseMessage, Encoder, JSONEncoder, BinaryEncoder
-from pulse.exceptions import EncodingError, DecodingError
+from pulse.exceptions import EncodingError, DecodingError, ValidationError
 
 
 class TestJSONEncoding:
@@ -45,6 +45,31 @@ class TestJSONEncoding:
         assert decoded.content["parameters"] == message.content["parameters"]
         assert decoded.envelope["sender"] == message.envelope["sender"]
 
+    def test_json_compact_and_indented_output(self):
+        """Test compact output has no whitespace and indented output parses back."""
+        import json
+
+        message = PulseMessage(action="ACT.QUERY.DATA", parameters={"limit": 10})
+
+        compact = JSONEncoder.encode(message, indent=None)
+        assert b" " not in compact
+        assert b"\n" not in compact
+
+        for indent in (2, 4):
+            pretty = JSONEncoder.encode(message, indent=indent)
+            assert b"\n" + b" " * indent + b'"envelope"' in pretty
+            assert json.loads(pretty) == json.loads(compact)
+
+    def test_json_roundtrip_large_integer(self):
+        """Test integers beyond 64 bits survive a JSON roundtrip."""
+        message = PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"big": 2**70}, validate=False
+        )
+
+        decoded = JSONEncoder.decode(JSONEncoder.encode(message, indent=None))
+
+        assert decoded.content["parameters"]["big"] == 2**70
+
 
 class TestBinaryEncoding:
     """Test binary (MessagePack) encoding functionality."""
@@ -130,10 +155,134 @@ class TestBinaryEncoding:
         assert params["list"] == [1, 2, 3]
         assert params["dict"] == {"key": "value"}
 
+    def test_binary_backend_wire_compatible(self):
+        """Test active backend output is readable by plain msgpack and back."""
+        import msgpack
+
+        message = PulseMessage(
+            action="ACT.QUERY.DATA",
+            parameters={"blob": b"\x00\x01", 1: "int-key"},
+            validate=False,
+        )
+
+        binary = BinaryEncoder.encode(message)
+        assert BinaryEncoder.BACKEND in ("ormsgpack", "msgpack", "msgpack-fallback")
+        assert msgpack.unpackb(binary, raw=False, strict_map_key=False) == message.to_dict()
+
+        reference = msgpack.packb(message.to_dict(), use_bin_type=True)
+        decoded = BinaryEncoder.decode(reference)
+        assert decoded.content["parameters"] == {"blob": b"\x00\x01", 1: "int-key"}
+
+    def test_binary_encode_batch_matches_single(self):
+        """Test batch encoding produces the same bytes as encoding one by one."""
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"index": i}) for i in range(5)
+        ]
+
+        payloads = BinaryEncoder.encode_batch(messages)
+
+        assert payloads == [BinaryEncoder.encode(m) for m in messages]
+
+    def test_binary_decode_batch_roundtrip(self):
+        """Test batch decoding restores every message in order."""
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"index": i}) for i in range(5)
+        ]
+
+        decoded = BinaryEncoder.decode_batch(BinaryEncoder.encode_batch(messages))
+
+        assert [m.to_dict() for m in decoded] == [m.to_dict() for m in messages]
+
+    def test_binary_batch_errors(self):
+        """Test batch operations wrap failures in encoder exceptions."""
+        with pytest.raises(EncodingError):
+            BinaryEncoder.encode_batch([object()])
+        with pytest.raises(DecodingError):
+            BinaryEncoder.decode_batch([b"\x00\x01\x02\x03"])
+
+    def test_binary_encode_recovers_after_error(self):
+        """Test a failed encode leaves the reused packer usable."""
+        message = PulseMessage(action="ACT.QUERY.DATA", parameters={"n": 1})
+        expected = BinaryEncoder.encode(message)
+
+        bad = PulseMessage(action="ACT.QUERY.DATA", parameters={"x": object()})
+        with pytest.raises(EncodingError):
+            BinaryEncoder.encode(bad)
+
+        assert BinaryEncoder.encode(message) == expected
+
+    def test_binary_encode_from_threads(self):
+        """Test concurrent encodes produce the same bytes as serial ones."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"i": i, "pad": "x" * i})
+            for i in range(200)
+        ]
+        expected = [BinaryEncoder.encode(m) for m in messages]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert list(executor.map(BinaryEncoder.encode, messages)) == expected
+
+    def test_pure_python_mode(self):
+        """Test PULSE_PURE_PYTHON selects pure-Python backends that still roundtrip."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import pulse.encoder as e\n"
+            "from pulse import PulseMessage\n"
+            "assert e.PURE_PYTHON and e.orjson is None and e.ormsgpack is None\n"
+            "assert e.BinaryEncoder.BACKEND == 'msgpack-fallback'\n"
+            "m = PulseMessage(action='ACT.QUERY.DATA', parameters={'n': [1, 2]})\n"
+            "for enc in (e.JSONEncoder, e.BinaryEncoder, e.CompactEncoder):\n"
+            "    assert enc.decode(enc.encode(m)).content['parameters'] == {'n': [1, 2]}\n"
+        )
+        env = dict(os.environ, PULSE_PURE_PYTHON="1")
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_import_pulse_defers_encoder(self):
+        """Test encoders load on first access and msgpack on first binary use."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, pulse\n"
+            "assert 'msgpack' not in sys.modules\n"
+            "assert 'pulse.encoder' not in sys.modules\n"
+            "from pulse import BinaryEncoder, JSONEncoder, PulseMessage\n"
+            "assert pulse.BinaryEncoder is BinaryEncoder\n"
+            "m = PulseMessage(action='ACT.QUERY.DATA')\n"
+            "JSONEncoder.decode(JSONEncoder.encode(m))\n"
+            "assert 'msgpack' not in sys.modules\n"
+            "BinaryEncoder.decode(BinaryEncoder.encode(m))\n"
+            "assert 'msgpack' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
 
 class TestPulseMessageMethods:
     """Test binary encoding methods on PulseMessage class."""
 
+    def test_to_binary_validate(self):
+        """Test to_binary(validate=True) rejects invalid messages."""
+        message = PulseMessage(action="ACT.INVALID.CONCEPT", validate=False)
+        assert message.to_binary()  # Encoding alone does not validate
+
+        with pytest.raises(ValidationError):
+            message.to_binary(validate=True)
+
+        valid = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+        assert valid.to_binary(validate=True) == valid.to_binary()
+
     def test_to_binary_method(self):
         """Test to_binary() method."""
         message = PulseMessage(action="ACT.QUERY.DATA")
@@ -209,6 +358,21 @@ class TestUnifiedEncoder:
 
         assert decoded.content["action"] == message.content["action"]
 
+    def test_decode_auto_detect_first_byte(self):
+        """Test auto-detection covers whitespace-led JSON, compact and bad input."""
+        message = PulseMessage(action="ACT.QUERY.DATA")
+        encoder = Encoder()
+
+        json_data = b"\n  " + encoder.encode(message, format="json")
+        assert encoder.decode(json_data).content["action"] == "ACT.QUERY.DATA"
+
+        compact_data = encoder.encode(message, format="compact")
+        assert encoder.decode(memoryview(compact_data)).content["action"] == "ACT.QUERY.DATA"
+
+        for bad in (b"", b"\x00\x01", b"\x93\x01\x02\x03"):
+            with pytest.raises(DecodingError, match="Failed to decode data"):
+                encoder.decode(bad)
+
     def test_decode_with_explicit_format(self):
         """Test decoding with explicitly specified format."""
         message = PulseMessage(action="ACT.QUERY.DATA")
@@ -226,6 +390,18 @@ class TestUnifiedEncoder:
 
         with pytest.raises(EncodingError, match="Unknown format"):
             encoder.encode(message, format="invalid")
+        with pytest.raises(DecodingError, match="Unknown format"):
+            encoder.decode(b"{}", format="invalid")
+
+    @pytest.mark.parametrize("fmt", ["json", "Binary", "COMPACT"])
+    def test_format_names_case_insensitive(self, fmt):
+        """Test explicit formats are matched regardless of case."""
+        message = PulseMessage(action="ACT.QUERY.DATA")
+        encoder = Encoder()
+
+        data = encoder.encode(message, format=fmt)
+        assert data == encoder.encode(message, format=fmt.lower())
+        assert encoder.decode(data, format=fmt).content["action"] == "ACT.QUERY.DATA"
 
     def test_get_size_comparison(self):
         """Test size comparison functionality."""
@@ -253,6 +429,59 @@ class TestUnifiedEncoder:
         assert 0 < comparison["binary_savings_percent"] < 100
         assert 0 < comparison["compact_savings_percent"] < 100
 
+    def test_get_size_comparison_tracks_mutation(self):
+        """Test memoized size comparison reflects changes to the message."""
+        message = PulseMessage(action="ACT.QUERY.DATA", parameters={"q": "a"})
+        encoder = Encoder()
+
+        before = encoder.get_size_comparison(message)
+        assert encoder.get_size_comparison(message) == before
+
+        message.content["parameters"]["q"] = "a" * 100
+        after = encoder.get_size_comparison(message)
+
+        assert after["json"] == len(JSONEncoder.encode(message, indent=None))
+        assert after["json"] > before["json"]
+
+    @pytest.mark.parametrize("fmt", ["json", "binary", "compact"])
+    @pytest.mark.parametrize("buffer_type", [bytearray, memoryview])
+    def test_decode_accepts_buffers(self, fmt, buffer_type):
+        """Test every format decodes from bytearray and memoryview input."""
+        message = PulseMessage(action="ACT.QUERY.DATA", parameters={"items": [1, 2]})
+        encoder = Encoder()
+        data = buffer_type(encoder.encode(message, format=fmt))
+
+        for decoded in (encoder.decode(data, format=fmt), encoder.decode(data)):
+            assert decoded.content["action"] == "ACT.QUERY.DATA"
+            assert decoded.content["parameters"] == {"items": [1, 2]}
+
+    def test_json_decode_memoryview_stdlib_fallback(self, monkeypatch):
+        """Test JSON memoryview input also works without orjson."""
+        import pulse.encoder
+
+        monkeypatch.setattr(pulse.encoder, "orjson", None)
+        message = PulseMessage(action="ACT.QUERY.DATA")
+        data = memoryview(JSONEncoder.encode(message))
+
+        assert JSONEncoder.decode(data).content["action"] == "ACT.QUERY.DATA"
+
+    @pytest.mark.parametrize("fmt", ["json", "binary", "compact", "BINARY"])
+    def test_encode_batch_matches_single(self, fmt):
+        """Test Encoder.encode_batch matches encoding messages one by one."""
+        encoder = Encoder()
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"i": i}) for i in range(5)
+        ]
+
+        assert encoder.encode_batch(messages, format=fmt) == [
+            encoder.encode(m, format=fmt) for m in messages
+        ]
+
+    def test_encode_batch_unknown_format(self):
+        """Test Encoder.encode_batch rejects unknown formats."""
+        with pytest.raises(EncodingError):
+            Encoder().encode_batch([PulseMessage(action="ACT.QUERY.DATA")], format="xml")
+
 
 class TestErrorHandling:
     """Test error handling in encoding/decoding."""
@@ -1,6 +1,7 @@
 """Tests for PULSE message core functionality."""
 import pytest
 import json
+import sys
 from datetime import datetime
 
 
@@ -61,6 +62,52 @@ class TestMessageCreation:
 
         assert message.envelope["version"] == "1.0"
 
+    def test_message_has_no_instance_dict(self, sample_action):
+        """Test that messages use __slots__ and reject unknown attributes."""
+        from pulse.message import PulseMessage
+
+        message = PulseMessage(action=sample_action)
+
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(AttributeError):
+            message.extra = "value"
+
+    def test_message_pickle_roundtrip(self, sample_action):
+        """Test that slotted messages still pickle."""
+        import pickle
+        from pulse.message import PulseMessage
+
+        message = PulseMessage(action=sample_action, parameters={"limit": 10})
+        restored = pickle.loads(pickle.dumps(message))
+
+        assert restored.to_dict() == message.to_dict()
+
+    def test_envelope_field_order_and_isolation(self, sample_action):
+        """Test envelopes keep wire field order and do not share state."""
+        from pulse.message import PulseMessage
+
+        message1 = PulseMessage(action=sample_action)
+        message2 = PulseMessage(action=sample_action)
+        message1.envelope["receiver"] = "agent-2"
+
+        assert list(message1.envelope) == [
+            "version", "timestamp", "sender", "receiver", "message_id", "nonce", "signature"
+        ]
+        assert message2.envelope["receiver"] is None
+
+    def test_concepts_are_interned(self):
+        """Test action and target share the vocabulary's concept strings."""
+        from pulse.message import PulseMessage
+        from pulse.vocabulary import Vocabulary
+
+        action = "".join(["ACT.QUERY.", "DATA"])
+        target = "".join(["ENT.DATA.", "TEXT"])
+        message = PulseMessage(action=action, target=target)
+
+        vocab_action = next(c for c in Vocabulary.CONCEPTS if c == "ACT.QUERY.DATA")
+        assert message.content["action"] is vocab_action
+        assert message.content["object"] is sys.intern("ENT.DATA.TEXT")
+
     def test_message_id_is_unique(self, sample_action):
         """Test that each message gets a unique message_id."""
         from pulse.message import PulseMessage
@@ -70,6 +117,25 @@ class TestMessageCreation:
 
         assert message1.envelope["message_id"] != message2.envelope["message_id"]
 
+    def test_message_id_is_uuid4_and_nonce_is_hex(self, sample_action):
+        """Test message_id is a canonical version 4 UUID and nonce is 128-bit hex."""
+        import uuid
+        from pulse.message import PulseMessage
+
+        message = PulseMessage(action=sample_action)
+
+        message_id = message.envelope["message_id"]
+        parsed = uuid.UUID(message_id)
+        assert str(parsed) == message_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
+        nonce = message.envelope["nonce"]
+        assert len(nonce) == 32
+        assert int(nonce, 16) >= 0
+        assert nonce == nonce.lower()
+        assert nonce != message_id.replace("-", "")
+
     def test_timestamp_is_iso_format(self, sample_action):
         """Test that timestamp is in ISO format."""
         from pulse.message import PulseMessage
@@ -85,6 +151,20 @@ class TestMessageCreation:
         parsed_time = datetime.fromisoformat(timestamp_clean)
         assert isinstance(parsed_time, datetime)
 
+    def test_timestamp_matches_current_utc_time(self, sample_action):
+        """Test that timestamps always carry microseconds and track the clock."""
+        import time
+        from pulse.message import PulseMessage
+
+        before = time.time()
+        timestamps = [PulseMessage(action=sample_action).envelope["timestamp"] for _ in range(50)]
+        after = time.time()
+
+        for timestamp in timestamps:
+            assert len(timestamp) == len("2026-01-01T00:00:00.000000Z")
+            parsed = datetime.fromisoformat(timestamp[:-1] + "+00:00")
+            assert before - 1e-3 <= parsed.timestamp() <= after + 1e-3
+
 
 class TestJSONSerialization:
     """Test JSON encoding and decoding."""
@@ -154,6 +234,36 @@ class TestJSONSerialization:
         assert recreated.content["action"] == original.content["action"]
         assert recreated.content["object"] == original.content["object"]
 
+    def test_to_json_compact_and_indented(self, sample_action):
+        """Test to_json() layout for compact and indented output."""
+        from pulse.message import PulseMessage
+
+        message = PulseMessage(action=sample_action, parameters={"text": "héllo"})
+
+        compact = message.to_json(indent=None)
+        assert compact == json.dumps(message.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        assert message.to_json(indent=4) == json.dumps(message.to_dict(), indent=4, ensure_ascii=False)
+        assert json.loads(message.to_json()) == message.to_dict()
+
+    def test_from_json_accepts_bytes(self, sample_action):
+        """Test from_json() and from_json_stream() parse UTF-8 bytes."""
+        import io
+        from pulse.message import PulseMessage
+
+        original = PulseMessage(action=sample_action, parameters={"text": "héllo"})
+        data = original.to_json().encode("utf-8")
+
+        for source in (data, bytearray(data), memoryview(data)):
+            assert PulseMessage.from_json(source).to_dict() == original.to_dict()
+        assert PulseMessage.from_json_stream(io.BytesIO(data)).to_dict() == original.to_dict()
+
+    def test_from_json_invalid_raises(self):
+        """Test from_json() raises JSONDecodeError on malformed input."""
+        from pulse.message import PulseMessage
+
+        with pytest.raises(json.JSONDecodeError):
+            PulseMessage.from_json("{not json")
+
     def test_json_roundtrip_preserves_data(self, sample_action, sample_target, sample_parameters):
         """Test that JSON roundtrip preserves all data."""
         from pulse.message import PulseMessage
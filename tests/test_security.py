@@ -2,7 +2,7 @@
 import pytest
 import time
 from datetime import datetime, timezone, timedelta
-from pulse import PulseMessage, SecurityManager, KeyManager, SecurityError
+from pulse import PulseMessage, SecurityManager, KeyManager, NonceStore, SecurityError
 
 
 class TestSecurityManager:
@@ -76,6 +76,36 @@ class TestSecurityManager:
 
         assert sig1 != sig2
 
+    def test_sign_batch(self):
+        """Test batch signing matches per-message signing."""
+        security = SecurityManager(secret_key="test-key")
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"i": i}, validate=False)
+            for i in range(5)
+        ]
+
+        signatures = security.sign_batch(messages)
+
+        assert len(signatures) == 5
+        for message, signature in zip(messages, signatures):
+            assert message.envelope['signature'] == signature
+            assert security.verify_signature(message)
+        assert security.sign_batch([]) == []
+
+    def test_verify_batch(self):
+        """Test batch verification reports each message separately."""
+        security = SecurityManager(secret_key="test-key")
+        messages = [
+            PulseMessage(action="ACT.QUERY.DATA", parameters={"i": i}, validate=False)
+            for i in range(4)
+        ]
+        security.sign_batch(messages)
+        messages[1].content['parameters']['i'] = 99
+        messages[3].envelope['signature'] = None
+
+        assert security.verify_batch(messages) == [True, False, True, False]
+        assert security.verify_batch([]) == []
+
     def test_verify_signature_valid(self):
         """Test signature verification with valid signature."""
         security = SecurityManager(secret_key="test-key")
@@ -104,6 +134,20 @@ class TestSecurityManager:
         # No signature
         assert not security.verify_signature(message)
 
+    def test_verify_signature_malformed(self):
+        """Test malformed signatures are rejected, not raised, even when they decode."""
+        security = SecurityManager(secret_key="test-key")
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+        signature = security.sign_message(message)
+
+        spaced = " ".join(signature[i:i + 2] for i in range(0, 64, 2))
+        for bad in (
+            "é" * 64, "zz" * 32, "abc", 12345,
+            signature.upper(), spaced, f" {signature}", f"{signature}\n", signature + "00",
+        ):
+            assert security.verify_signature(message, expected_signature=bad) is False
+        assert security.verify_signature(message, expected_signature=signature) is True
+
     def test_verify_signature_wrong_key(self):
         """Test signature verification with wrong key."""
         security1 = SecurityManager(secret_key="key1")
@@ -115,6 +159,54 @@ class TestSecurityManager:
         # Different key
         assert not security2.verify_signature(message)
 
+    def test_signature_matches_plain_hmac(self):
+        """Test signatures equal a one-shot HMAC-SHA256 for short, block-sized and long keys."""
+        import hashlib
+        import hmac
+
+        security = SecurityManager(secret_key="test-key")
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+        canonical = security._create_canonical_string(message)
+
+        for key in ("test-key", "", "k" * 64, "k" * 65, "ключ" * 20):
+            security = SecurityManager(secret_key=key)
+            expected = hmac.new(
+                key.encode("utf-8"), canonical.encode("utf-8"), hashlib.sha256
+            ).hexdigest()
+            assert security.sign_message(message) == expected
+
+    def test_canonical_string_format(self):
+        """Test canonical string is compact JSON with sorted keys and no signature."""
+        import json
+
+        security = SecurityManager(secret_key="test-key")
+        message = PulseMessage(action="ACT.QUERY.DATA", parameters={"b": 1, "a": "é"}, validate=False)
+        security.sign_message(message)
+
+        canonical = security._create_canonical_string(message)
+        data = message.to_dict()
+        del data["envelope"]["signature"]
+        assert canonical == json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+    def test_verify_does_not_touch_envelope(self):
+        """Test verification leaves the stored signature in place."""
+        security = SecurityManager(secret_key="test-key")
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+        signature = security.sign_message(message)
+
+        assert security.verify_signature(message, expected_signature="0" * 64) is False
+        assert message.envelope["signature"] == signature
+
+    def test_changing_secret_key_rekeys(self):
+        """Test assigning a new secret_key changes subsequent signatures."""
+        security = SecurityManager(secret_key="key1")
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+        security.sign_message(message)
+
+        security.secret_key = "key2"
+        assert not security.verify_signature(message)
+        assert security.sign_message(message) == SecurityManager("key2").sign_message(message)
+
     def test_verify_signature_with_explicit_signature(self):
         """Test signature verification with explicitly provided signature."""
         security = SecurityManager(secret_key="test-key")
@@ -234,6 +326,22 @@ class TestReplayProtection:
         assert not result['timestamp_valid']
         assert "missing timestamp" in result['reason'].lower()
 
+    def test_check_replay_protection_timestamp_offsets(self):
+        """Test ages honour UTC offsets and naive timestamps are rejected."""
+        security = SecurityManager()
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+
+        ten_ago = datetime.now(timezone(timedelta(hours=5))) - timedelta(seconds=10)
+        message.envelope['timestamp'] = ten_ago.isoformat()
+        result = security.check_replay_protection(message)
+        assert result['is_valid']
+        assert 9 < result['age_seconds'] < 12
+
+        message.envelope['timestamp'] = datetime.now().isoformat()
+        result = security.check_replay_protection(message)
+        assert not result['is_valid']
+        assert "invalid timestamp" in result['reason'].lower()
+
     def test_check_replay_protection_nonce_deduplication(self):
         """Test replay protection with nonce store."""
         security = SecurityManager()
@@ -285,6 +393,59 @@ class TestReplayProtection:
         assert result['is_valid']
 
 
+class TestNonceStore:
+    """Test the time-bounded nonce store."""
+
+    def test_replay_detected(self):
+        """Test NonceStore works as the nonce_store for replay checks."""
+        nonce_store = NonceStore()
+        message = PulseMessage(action="ACT.QUERY.DATA", validate=False)
+
+        assert SecurityManager.check_replay_protection(message, nonce_store=nonce_store)['is_valid']
+        result = SecurityManager.check_replay_protection(message, nonce_store=nonce_store)
+        assert not result['is_valid']
+        assert result['nonce_unique'] is False
+
+    def test_nonces_expire_after_two_periods(self, monkeypatch):
+        """Test nonces are kept for at least ttl_seconds and then dropped."""
+        import pulse.security
+
+        now = [1000.0]
+        monkeypatch.setattr(pulse.security.time, "monotonic", lambda: now[0])
+        nonce_store = NonceStore(ttl_seconds=10)
+
+        nonce_store.add("a")
+        now[0] += 9
+        nonce_store.add("b")
+        now[0] += 2  # First rotation: "a" and "b" move to the old generation
+        assert "a" in nonce_store and "b" in nonce_store
+        assert len(nonce_store) == 2
+
+        now[0] += 10  # Second rotation: both are at least 10s old
+        assert "a" not in nonce_store
+        assert "b" not in nonce_store
+        assert len(nonce_store) == 0
+
+    def test_idle_store_forgets_everything(self, monkeypatch):
+        """Test a long idle gap drops both generations at once."""
+        import pulse.security
+
+        now = [0.0]
+        monkeypatch.setattr(pulse.security.time, "monotonic", lambda: now[0])
+        nonce_store = NonceStore(ttl_seconds=10)
+        nonce_store.add("a")
+
+        now[0] += 25
+        assert "a" not in nonce_store
+
+    def test_clear(self):
+        """Test clear() forgets all nonces."""
+        nonce_store = NonceStore()
+        nonce_store.add("a")
+        nonce_store.clear()
+        assert "a" not in nonce_store
+
+
 class TestKeyManager:
     """Test KeyManager functionality."""
 
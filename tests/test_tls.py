@@ -17,7 +17,7 @@ import tempfile
 import threading
 import pytest
 
-from pulse.tls import TLSConfig, generate_self_signed_cert
+from pulse.tls import TLSConfig, TLSSessionCache, generate_self_signed_cert
 from pulse.message import PulseMessage
 from pulse.client import PulseClient
 from pulse.server import PulseServer
@@ -370,6 +370,42 @@ class TestTLSServerClient:
         result = client.send_fire_and_forget(message)
         assert result is True
 
+    def test_https_resumes_tls_session(self, tls_server, monkeypatch):
+        """Test that reconnects resume the cached TLS session."""
+        from pulse.client import _ResumingHTTPSConnection
+
+        port, cert_path = tls_server
+        reused = []
+        original_connect = _ResumingHTTPSConnection.connect
+
+        def recording_connect(self):
+            original_connect(self)
+            reused.append(self.sock.session_reused)
+
+        monkeypatch.setattr(_ResumingHTTPSConnection, "connect", recording_connect)
+
+        client = PulseClient(
+            f"https://localhost:{port}",
+            tls=TLSConfig(cafile=cert_path),
+        )
+        # PulseServer closes the connection after each response
+        for _ in range(3):
+            client.send(PulseMessage(action="ACT.QUERY.DATA"))
+
+        assert reused == [False, True, True]
+        assert len(client._tls_sessions) == 1
+
+    def test_tls_session_cache_disabled(self, tls_server):
+        """Test that session resumption can be turned off."""
+        port, cert_path = tls_server
+        client = PulseClient(
+            f"https://localhost:{port}",
+            tls=TLSConfig(cafile=cert_path),
+            tls_session_cache_enabled=False,
+        )
+        assert client._tls_sessions is None
+        assert client.send(PulseMessage(action="ACT.QUERY.DATA")).type == "RESPONSE"
+
     def test_https_ping(self, tls_server):
         """Test health check over HTTPS."""
         port, cert_path = tls_server
@@ -386,6 +422,52 @@ class TestTLSServerClient:
         assert health["status_code"] == 200
 
 
+class TestTLSSessionCache:
+    """Test the client TLS session cache."""
+
+    def test_put_get(self):
+        """Test storing and retrieving a session."""
+        cache = TLSSessionCache()
+        session = object()
+        cache.put(("host", 443), session)
+        assert cache.get(("host", 443)) is session
+        assert cache.get(("other", 443)) is None
+
+    def test_expired_session_dropped(self, monkeypatch):
+        """Test that sessions older than ttl are not returned."""
+        import pulse.tls
+
+        now = [100.0]
+        monkeypatch.setattr(pulse.tls.time, "monotonic", lambda: now[0])
+        cache = TLSSessionCache(ttl=10)
+        cache.put("key", object())
+        now[0] += 10
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used session is evicted."""
+        cache = TLSSessionCache(maxsize=2)
+        cache.put("a", "session-a")
+        cache.put("b", "session-b")
+        cache.get("a")
+        cache.put("c", "session-c")
+        assert cache.get("b") is None
+        assert cache.get("a") == "session-a"
+        assert cache.get("c") == "session-c"
+
+    def test_invalid_arguments(self):
+        """Test that invalid size and ttl are rejected."""
+        with pytest.raises(ValueError):
+            TLSSessionCache(maxsize=0)
+        with pytest.raises(ValueError):
+            TLSSessionCache(ttl=0)
+
+    def test_http_client_has_no_cache(self):
+        """Test that plain HTTP clients do not create a session cache."""
+        assert PulseClient("http://localhost:8080")._tls_sessions is None
+
+
 class TestTLSConfigValidation:
     """Test TLS configuration edge cases."""
 
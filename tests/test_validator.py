@@ -184,6 +184,22 @@ class TestFullMessageValidation:
         with pytest.raises(ValidationError):
             PulseMessage(action="INVALID.ACTION")
 
+    def test_empty_sender_on_creation_fails(self):
+        """Test empty or blank sender on creation fails."""
+        for sender in ("", "   "):
+            with pytest.raises(ValidationError, match="Sender ID cannot be empty"):
+                PulseMessage(action="ACT.QUERY.DATA", sender=sender)
+
+    def test_sender_checked_before_content_on_creation(self):
+        """Test creation reports envelope errors before content errors, like validate()."""
+        with pytest.raises(ValidationError, match="Sender ID"):
+            PulseMessage(action="INVALID.ACTION", sender="")
+
+    def test_created_message_passes_full_validation(self):
+        """Test a message accepted at creation also passes validate()."""
+        message = PulseMessage(action="ACT.QUERY.DATA", target="ENT.DATA.TEXT", sender="agent-1")
+        assert message.validate() is True
+
     def test_can_skip_validation_on_creation(self):
         """Test can skip validation on creation."""
         # Should not raise even with invalid action
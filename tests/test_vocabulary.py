@@ -143,6 +143,19 @@ class TestVocabularyCategories:
         """Test getting category of entity concept."""
         assert Vocabulary.get_category("ENT.DATA.TEXT") == "ENT"
 
+    def test_concept_index_roundtrip(self):
+        """Test integer indexes are dense, sorted and reversible."""
+        total = Vocabulary.get_total_count()
+        indexes = [Vocabulary.get_concept_index(c) for c in sorted(Vocabulary.CONCEPTS)]
+        assert indexes == list(range(total))
+        assert Vocabulary.get_concept_by_index(Vocabulary.get_concept_index("ACT.QUERY.DATA")) == "ACT.QUERY.DATA"
+
+    def test_concept_index_unknown(self):
+        """Test unknown concepts and out-of-range indexes return None."""
+        assert Vocabulary.get_concept_index("INVALID.CONCEPT") is None
+        assert Vocabulary.get_concept_by_index(-1) is None
+        assert Vocabulary.get_concept_by_index(Vocabulary.get_total_count()) is None
+
     def test_get_category_nonexistent(self):
         """Test getting category of non-existent concept returns None."""
         assert Vocabulary.get_category("INVALID.CONCEPT") is None
@@ -239,6 +252,35 @@ class TestVocabularyCategories:
         result = Vocabulary.list_by_category("NONEXISTENT")
         assert result == []
 
+    def test_list_by_category_returns_copy(self):
+        """Test mutating a returned list does not affect later calls."""
+        first = Vocabulary.list_by_category("LOG")
+        first.clear()
+        assert len(Vocabulary.list_by_category("LOG")) == 50
+
+    def test_list_by_prefix(self):
+        """Test listing concepts under a dotted prefix."""
+        analyze = Vocabulary.list_by_prefix("ACT.ANALYZE")
+        expected = [c for c in Vocabulary.CONCEPTS if c.startswith("ACT.ANALYZE.")]
+        assert sorted(analyze) == sorted(expected)
+        assert "ACT.ANALYZE.SENTIMENT" in analyze
+
+    def test_list_by_prefix_matches_whole_segments(self):
+        """Test prefix matching does not split segments."""
+        assert Vocabulary.list_by_prefix("ACT.ANALYZ") == []
+        assert Vocabulary.list_by_prefix("ACT.ANALYZE.") == Vocabulary.list_by_prefix("ACT.ANALYZE")
+
+    def test_list_by_prefix_category(self):
+        """Test a category prefix lists the whole category."""
+        assert sorted(Vocabulary.list_by_prefix("META")) == sorted(Vocabulary.list_by_category("META"))
+
+    def test_list_by_prefix_returns_copy(self):
+        """Test mutating a returned list does not affect later calls."""
+        first = Vocabulary.list_by_prefix("META.STATUS")
+        count = len(first)
+        first.clear()
+        assert len(Vocabulary.list_by_prefix("META.STATUS")) == count
+
 
 class TestVocabularyDescriptions:
     """Test description and documentation."""
@@ -323,6 +365,22 @@ class TestVocabularySearch:
         results = Vocabulary.search("mesh")
         assert any("TOPO" in r for r in results)
 
+    def test_search_does_not_match_across_fields(self):
+        """Test a query spanning two fields of a concept does not match."""
+        concept = "ACT.ANALYZE.SENTIMENT"
+        description = Vocabulary.get_description(concept).lower()
+        spanning = concept.lower()[-3:] + description[:3]
+        assert concept not in Vocabulary.search(spanning)
+        assert Vocabulary.search("a\x00b") == []
+
+    def test_search_returns_copy(self):
+        """Test repeated searches return equal but independent lists."""
+        first = Vocabulary.search("sentiment")
+        first.append("MUTATED")
+        second = Vocabulary.search("sentiment")
+        assert "MUTATED" not in second
+        assert "ACT.ANALYZE.SENTIMENT" in second
+
 
 class TestVocabularyCounts:
     """Test vocabulary counting functions."""
@@ -383,6 +441,11 @@ class TestVocabularyIntegrity:
                 f"{concept} should start with {category}."
             )
 
+    def test_concept_set_matches_concepts(self):
+        """Test CONCEPT_SET is a frozenset of exactly the concept IDs."""
+        assert isinstance(Vocabulary.CONCEPT_SET, frozenset)
+        assert Vocabulary.CONCEPT_SET == set(Vocabulary.CONCEPTS)
+
     def test_no_duplicate_concepts(self):
         """Test no duplicate concept IDs exist."""
         concepts = list(Vocabulary.CONCEPTS.keys())